@@ -1,6 +1,5 @@
 """Example of config-based dynamic tool registration."""
 
-import asyncio
 import json
 from openai import AsyncOpenAI
 
@@ -12,6 +11,7 @@ from dynamic_tools.models.tool_config import EXAMPLE_STOCK_QUOTE_CONFIG
 from dynamic_tools.factory.tool_factory import ToolFactory
 from dynamic_tools.core.registry import ToolRegistry
 from dynamic_tools.core.orchestrator import AIOrchestrator
+from dynamic_tools.utils import run_async
 
 
 async def main():
@@ -98,5 +98,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_async(main())
 
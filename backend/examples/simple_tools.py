@@ -1,6 +1,5 @@
 """Simple tool examples using the dynamic tools system."""
 
-import asyncio
 import httpx
 from pydantic import BaseModel, Field
 from openai import AsyncOpenAI
@@ -12,6 +11,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 from dynamic_tools.decorators import tool
 from dynamic_tools.core.registry import ToolRegistry
 from dynamic_tools.core.orchestrator import AIOrchestrator
+from dynamic_tools.utils import run_async
 
 load_dotenv()
 
@@ -155,4 +155,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_async(main())
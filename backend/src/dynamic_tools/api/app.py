@@ -6,18 +6,24 @@ from fastapi.middleware.cors import CORSMiddleware
 import sys
 from loguru import logger
 
-from .endpoints import router, _global_registry
-from .database_endpoints import router as db_router
+from .endpoints import router, _global_registry, aclose_cached_services
+from .database_endpoints import router as db_router, close_cached_services
 from .proxy import router as proxy_router
 from ..services.supabase_service import SupabaseService
 from ..factory.tool_factory import ToolFactory
 from ..config.settings import get_settings
+from ..models.tool_config import ToolConfig, ApiConfig
+from ..models.enums import HttpMethod
 
 # Configure loguru
 logger.remove()  # Remove default handler
 logger.add(sys.stdout, level="INFO")
 logger.add("logs/app.log", rotation="500 MB", retention="10 days", level="INFO")
 
+# Method strings as stored in the database, in either case, mapped to the enum
+_METHOD_LOOKUP: dict[str, HttpMethod] = {m.name: m for m in HttpMethod}
+_METHOD_LOOKUP.update({m.name.lower(): m for m in HttpMethod})
+
 app = FastAPI(
     title="LLM HTTP Service",
     description="LLM-powered HTTP service with MCP support and dynamic_tools integration",
@@ -48,10 +54,18 @@ async def load_tools_from_database():
     """
     try:
         settings = get_settings()
-        db = SupabaseService(settings.supabase_url, settings.supabase_key)
+        db = SupabaseService(
+            settings.supabase_url,
+            settings.supabase_key,
+            pool_min=settings.supabase_pool_min,
+            pool_max=settings.supabase_pool_max,
+        )
         
         # Get all tools from database
-        tools = await db.get_tools()
+        try:
+            tools = await db.get_tools()
+        finally:
+            db.close()
         logger.info(f"📦 Found {len(tools)} tools in database")
         
         # Register each tool in the workflow registry
@@ -62,22 +76,16 @@ async def load_tools_from_database():
             # Only register tools with basic HTTP info
             if tool.method and tool.url and tool.name:
                 try:
-                    # Create a simple tool config from database tool
-                    from ..models.tool_config import ToolConfig, ApiConfig
-                    from ..models.enums import HttpMethod
-                    
-                    # Convert method string to enum
-                    method_enum = HttpMethod[tool.method.upper()] if tool.method else HttpMethod.GET
+                    # Convert method string to enum (mixed case falls back to upper())
+                    method_enum = _METHOD_LOOKUP.get(tool.method) or HttpMethod[tool.method.upper()]
                     
-                    # Create tool config
+                    # Create a simple tool config from database tool
                     tool_config = ToolConfig(
                         name=tool.name,
                         description=tool.description or f"API tool: {tool.name}",
                         api=ApiConfig(
                             base_url=tool.url,
                             method=method_enum,
-                            headers={},
-                            params={}
                         ),
                         input_schema={"type": "object", "properties": {}},
                         output_schema={"type": "object"}
@@ -101,6 +109,13 @@ async def load_tools_from_database():
         # Don't crash the app, just log the error
 
 
+@app.on_event("shutdown")
+async def close_service_clients():
+    """Close the HTTP clients held by the endpoints' cached services."""
+    await aclose_cached_services()
+    close_cached_services()
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint.
@@ -3,6 +3,7 @@
 These endpoints provide REST API access to all database entities.
 """
 
+from functools import lru_cache
 from typing import List, Optional
 from uuid import UUID
 from fastapi import APIRouter, HTTPException, status, Depends
@@ -22,12 +23,57 @@ from ..config.settings import Settings, get_settings
 # Create router
 router = APIRouter(prefix="/api", tags=["database"])
 
+# Every service _get_supabase_service has built, so their clients can be
+# closed at shutdown
+_cached_services: list = []
+
+
+@lru_cache(maxsize=8)
+def _get_supabase_service(
+    supabase_url: str,
+    supabase_key: str,
+    pool_min: int,
+    pool_max: int,
+) -> SupabaseService:
+    """Return the shared Supabase service for the given settings.
+    
+    Reusing it keeps one Supabase client, and its HTTP connections, across
+    requests instead of creating a new client each time.
+    
+    Args:
+        supabase_url: Supabase project URL
+        supabase_key: Supabase API key
+        pool_min: Idle connections kept open for reuse
+        pool_max: Maximum open connections
+        
+    Returns:
+        SupabaseService reused across requests
+    """
+    service = SupabaseService(
+        supabase_url=supabase_url,
+        supabase_key=supabase_key,
+        pool_min=pool_min,
+        pool_max=pool_max,
+    )
+    _cached_services.append(service)
+    return service
+
+
+def close_cached_services() -> None:
+    """Close the clients of every cached service and empty the cache."""
+    _get_supabase_service.cache_clear()
+    while _cached_services:
+        _cached_services.pop().close()
+
+
 # Dependency to get Supabase service
 def get_supabase_service(settings: Settings = Depends(get_settings)) -> SupabaseService:
     """Get Supabase service instance."""
-    return SupabaseService(
-        supabase_url=settings.supabase_url,
-        supabase_key=settings.supabase_key
+    return _get_supabase_service(
+        settings.supabase_url,
+        settings.supabase_key,
+        settings.supabase_pool_min,
+        settings.supabase_pool_max,
     )
 
 
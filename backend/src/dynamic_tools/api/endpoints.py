@@ -1,5 +1,7 @@
 """FastAPI endpoint implementations for LLM HTTP Service."""
 
+from functools import lru_cache
+
 from fastapi import APIRouter, HTTPException, status, Depends
 from loguru import logger
 
@@ -26,6 +28,53 @@ router = APIRouter(prefix="/api")
 # Global tool registry (shared across requests)
 _global_registry = ToolRegistry()
 
+# Every service the cached getters below have built, so their clients can be
+# closed at shutdown
+_cached_services: list = []
+
+
+@lru_cache(maxsize=8)
+def _get_prompt_service(api_key: str, max_retries: int) -> PromptService:
+    """Return the shared prompt service for the given settings.
+    
+    Reusing it keeps one AsyncOpenAI client, and its connection pool,
+    across requests instead of opening a new one each time.
+    
+    Args:
+        api_key: OpenAI API key
+        max_retries: Maximum number of retry attempts
+        
+    Returns:
+        PromptService reused across requests
+    """
+    service = PromptService(api_key=api_key, max_retries=max_retries)
+    _cached_services.append(service)
+    return service
+
+
+@lru_cache(maxsize=8)
+def _get_http_client(timeout: float, max_retries: int) -> HTTPClientService:
+    """Return the shared HTTP client service for the given settings.
+    
+    Args:
+        timeout: Request timeout in seconds
+        max_retries: Maximum number of retry attempts
+        
+    Returns:
+        HTTPClientService reused across requests
+    """
+    service = HTTPClientService(timeout=timeout, max_retries=max_retries)
+    _cached_services.append(service)
+    return service
+
+
+async def aclose_cached_services() -> None:
+    """Close the clients of every cached service and empty the caches."""
+    _get_prompt_service.cache_clear()
+    _get_http_client.cache_clear()
+    while _cached_services:
+        await _cached_services.pop().aclose()
+
 
 @router.post(
     "/prompt",
@@ -53,10 +102,7 @@ async def prompt_endpoint(
         logger.info(f"Processing prompt: {request.instructions[:50]}...")
         
         # Initialize service with settings
-        prompt_service = PromptService(
-            api_key=settings.openai_api_key,
-            max_retries=settings.llm_max_retries
-        )
+        prompt_service = _get_prompt_service(settings.openai_api_key, settings.llm_max_retries)
         
         # Process prompt
         response = await prompt_service.prompt_normal(request)
@@ -98,10 +144,7 @@ async def prompt_mcp_endpoint(
         logger.info(f"Processing MCP prompt: {request.instructions[:50]}...")
         
         # Initialize service with settings
-        prompt_service = PromptService(
-            api_key=settings.openai_api_key,
-            max_retries=settings.llm_max_retries
-        )
+        prompt_service = _get_prompt_service(settings.openai_api_key, settings.llm_max_retries)
         
         # Process MCP prompt
         response = await prompt_service.prompt_mcp(request)
@@ -140,10 +183,7 @@ async def execute_endpoint(
         logger.info(f"Executing HTTP request: {request.http_spec.method} {request.http_spec.url}")
         
         # Initialize HTTP client with settings
-        http_client = HTTPClientService(
-            timeout=settings.http_timeout,
-            max_retries=settings.http_max_retries
-        )
+        http_client = _get_http_client(settings.http_timeout, settings.http_max_retries)
         
         # Execute request
         response_spec = await http_client.execute(request.http_spec)
@@ -193,10 +233,7 @@ async def prompt_execute_endpoint(
         
         # Step 1: Generate HTTP spec using LLM
         logger.info("Step 1: Generating HTTP spec...")
-        prompt_service = PromptService(
-            api_key=settings.openai_api_key,
-            max_retries=settings.llm_max_retries
-        )
+        prompt_service = _get_prompt_service(settings.openai_api_key, settings.llm_max_retries)
         prompt_response = await prompt_service.prompt_mcp(request)
         
         if prompt_response.type != "http_spec":
@@ -208,10 +245,7 @@ async def prompt_execute_endpoint(
         
         # Step 2: Execute the HTTP request
         logger.info("Step 2: Executing HTTP request...")
-        http_client = HTTPClientService(
-            timeout=settings.http_timeout,
-            max_retries=settings.http_max_retries
-        )
+        http_client = _get_http_client(settings.http_timeout, settings.http_max_retries)
         response_spec = await http_client.execute(http_spec)
         
         logger.info(f"Prompt-execute flow completed: {response_spec.status_code}")
@@ -298,15 +332,9 @@ async def workflow_endpoint(
         # Initialize services (use global registry)
         tool_registry = _global_registry
         
-        prompt_service = PromptService(
-            api_key=settings.openai_api_key,
-            max_retries=settings.llm_max_retries
-        )
+        prompt_service = _get_prompt_service(settings.openai_api_key, settings.llm_max_retries)
         
-        http_client = HTTPClientService(
-            timeout=settings.http_timeout,
-            max_retries=settings.http_max_retries
-        )
+        http_client = _get_http_client(settings.http_timeout, settings.http_max_retries)
         
         # Create orchestrator
         orchestrator = WorkflowOrchestrator(
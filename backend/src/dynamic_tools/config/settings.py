@@ -5,7 +5,7 @@ management with environment variable loading and validation.
 """
 
 from typing import Optional
-from pydantic import Field, field_validator
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -22,6 +22,8 @@ class Settings(BaseSettings):
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         openai_api_key: OpenAI API key for LLM integration
         claude_api_key: Optional Claude API key for future integration
+        supabase_pool_min: Idle Supabase connections kept open for reuse
+        supabase_pool_max: Maximum open Supabase connections
         http_timeout: Default HTTP request timeout in seconds
         http_max_retries: Maximum number of retry attempts for failed HTTP requests
         llm_max_retries: Maximum number of retry attempts for failed LLM calls
@@ -67,6 +69,18 @@ class Settings(BaseSettings):
         ...,
         description="Supabase API key (required)"
     )
+    supabase_pool_min: int = Field(
+        default=2,
+        ge=0,
+        le=100,
+        description="Idle Supabase connections kept open for reuse"
+    )
+    supabase_pool_max: int = Field(
+        default=10,
+        ge=1,
+        le=100,
+        description="Maximum open Supabase connections"
+    )
     
     # HTTP Client settings
     http_timeout: float = Field(
@@ -134,6 +148,16 @@ class Settings(BaseSettings):
         if not v.startswith("sk-"):
             raise ValueError("openai_api_key must start with 'sk-'")
         return v
+    
+    @model_validator(mode="after")
+    def validate_supabase_pool(self) -> "Settings":
+        """Validate the Supabase pool keeps no more idle connections than it may open."""
+        if self.supabase_pool_min > self.supabase_pool_max:
+            raise ValueError(
+                f"supabase_pool_min ({self.supabase_pool_min}) must not exceed "
+                f"supabase_pool_max ({self.supabase_pool_max})"
+            )
+        return self
 
 
 # Global settings instance
@@ -6,6 +6,7 @@ import asyncio
 import inspect
 import time
 from typing import Any, Callable
+import httpx
 from pydantic import BaseModel, ValidationError
 from loguru import logger
 
@@ -28,13 +29,32 @@ class ToolExecutor:
     - Execution time tracking
     """
 
-    def __init__(self, registry: ToolRegistry) -> None:
+    def __init__(self, registry: ToolRegistry, http_client: httpx.AsyncClient | None = None) -> None:
         """Initialize the tool executor.
 
         Args:
             registry: ToolRegistry containing registered tools
+            http_client: Optional client shared by API tools. When omitted, the
+                executor creates its own pooled client on first use; close it
+                with aclose().
         """
         self.registry = registry
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+        # tool name -> (input schema the model was built from, validation model)
+        self._input_models: dict[str, tuple[dict, type[BaseModel]]] = {}
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if the executor created it."""
+        if self._owns_http_client and self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating the executor's own if needed."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient()
+        return self._http_client
 
     async def execute(
         self,
@@ -137,27 +157,47 @@ class ToolExecutor:
         """
         # If schema has properties, validate against them
         if "properties" in input_schema:
-            # Create a temporary Pydantic model for validation
-            from pydantic import create_model, Field
+            ValidationModel = self._get_input_model(tool_name, input_schema)
+            validated = ValidationModel(**arguments)
+            return validated.model_dump()
 
-            fields = {}
-            properties = input_schema.get("properties", {})
-            required = input_schema.get("required", [])
+        return arguments
 
-            for field_name, field_schema in properties.items():
-                field_type = self._json_type_to_python(field_schema)
-                is_required = field_name in required
+    def _get_input_model(self, tool_name: str, input_schema: dict) -> type[BaseModel]:
+        """Get the Pydantic model that validates a tool's inputs.
 
-                if is_required:
-                    fields[field_name] = (field_type, ...)
-                else:
-                    fields[field_name] = (field_type, None)
+        The model is built on first use and reused for later calls, as long as
+        the tool's definition still holds the same schema object.
 
-            ValidationModel = create_model(f"{tool_name}_InputValidation", **fields)  # type: ignore
-            validated = ValidationModel(**arguments)
-            return validated.model_dump()
+        Args:
+            tool_name: Name of the tool
+            input_schema: JSON schema for inputs
 
-        return arguments
+        Returns:
+            Pydantic model class for the schema's properties
+        """
+        cached = self._input_models.get(tool_name)
+        if cached is not None and cached[0] is input_schema:
+            return cached[1]
+
+        from pydantic import create_model
+
+        fields = {}
+        properties = input_schema.get("properties", {})
+        required = input_schema.get("required", [])
+
+        for field_name, field_schema in properties.items():
+            field_type = self._json_type_to_python(field_schema)
+            is_required = field_name in required
+
+            if is_required:
+                fields[field_name] = (field_type, ...)
+            else:
+                fields[field_name] = (field_type, None)
+
+        ValidationModel = create_model(f"{tool_name}_InputValidation", **fields)  # type: ignore
+        self._input_models[tool_name] = (input_schema, ValidationModel)
+        return ValidationModel
 
     def _validate_outputs(
         self,
@@ -243,6 +283,11 @@ class ToolExecutor:
         # This is the case when using @tool decorator with a single Pydantic input
         import inspect as insp
         
+        # API tools send their request through the executor's pooled client
+        execute_with_client = getattr(tool, "execute_with_client", None)
+        if callable(execute_with_client):
+            return await execute_with_client(self._get_http_client(), **arguments)
+
         # Skip signature inspection for objects with execute method (like GenericApiTool)
         if hasattr(tool, "execute") and callable(tool.execute) and not hasattr(tool, "_is_async"):
             return await tool.execute(**arguments)
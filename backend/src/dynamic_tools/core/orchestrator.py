@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from typing import Any
 from openai import AsyncOpenAI
 from pydantic import BaseModel
@@ -10,6 +11,7 @@ from loguru import logger
 from .base import ToolCallRequest, ToolResult
 from .registry import ToolRegistry
 from .executor import ToolExecutor
+from ..utils import gather_bounded
 
 
 class AIOrchestrator:
@@ -25,6 +27,7 @@ class AIOrchestrator:
         registry: ToolRegistry,
         model: str = "gpt-4o-mini",
         max_tool_iterations: int = 5,
+        max_parallel_tool_calls: int = 8,
     ) -> None:
         """Initialize the AI orchestrator.
 
@@ -33,6 +36,7 @@ class AIOrchestrator:
             registry: ToolRegistry with registered tools
             model: Model name to use
             max_tool_iterations: Maximum number of tool calling iterations
+            max_parallel_tool_calls: Maximum tool calls executed concurrently
         """
         if not client:
             raise ValueError("OpenAI client must be provided")
@@ -42,9 +46,23 @@ class AIOrchestrator:
         self.executor = ToolExecutor(registry)
         self.model = model
         self.max_tool_iterations = max_tool_iterations
+        self.max_parallel_tool_calls = max_parallel_tool_calls
 
         logger.info(f"AIOrchestrator initialized with model: {model}")
 
+    async def __aenter__(self) -> AIOrchestrator:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the executor's HTTP client.
+
+        The OpenAI client was passed in by the caller and is left open.
+        """
+        await self.executor.aclose()
+
     async def run(
         self,
         input: str | list[dict],
@@ -102,19 +120,23 @@ class AIOrchestrator:
                 
                 if tool_calls:
                     logger.info(f"LLM requested {len(tool_calls)} tool call(s)")
-                    tool_results = []
                     
-                    for tool_call in tool_calls:
-                        import json
+                    async def _run_tool_call(tool_call: Any) -> dict:
                         arguments = json.loads(tool_call.arguments) if isinstance(tool_call.arguments, str) else tool_call.arguments
                         
                         logger.info(f"Executing tool: {tool_call.name} with args: {arguments}")
                         result = await self.executor.execute(tool_call.name, arguments)
-                        tool_results.append({
+                        return {
                             'tool_name': tool_call.name,
                             'call_id': tool_call.call_id,
                             'result': result
-                        })
+                        }
+                    
+                    # Tool calls are independent; run them concurrently, bounded
+                    tool_results = await gather_bounded(
+                        (_run_tool_call(tool_call) for tool_call in tool_calls),
+                        limit=self.max_parallel_tool_calls,
+                    )
                     
                     # Return structured results
                     return {
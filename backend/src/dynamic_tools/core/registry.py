@@ -18,6 +18,8 @@ class ToolRegistry:
         """Initialize the tool registry."""
         self._tools: dict[str, BaseTool] = {}
         self._definitions: dict[str, ToolDefinition] = {}
+        # OpenAI function-tool dicts, built once at registration
+        self._openai_tools: dict[str, dict] = {}
 
     def register(self, tool: BaseTool | Callable) -> None:
         """Register a tool.
@@ -38,6 +40,7 @@ class ToolRegistry:
 
             self._tools[tool_name] = tool  # type: ignore
             self._definitions[tool_name] = tool_def
+            self._openai_tools[tool_name] = tool_def.to_openai_tool()
             logger.info(f"Registered tool: {tool_name}")
             return
 
@@ -55,6 +58,7 @@ class ToolRegistry:
                 input_schema=tool.input_schema,
                 output_schema=tool.output_schema,
             )
+            self._openai_tools[tool_name] = self._definitions[tool_name].to_openai_tool()
             logger.info(f"Registered tool: {tool_name}")
             return
 
@@ -76,6 +80,7 @@ class ToolRegistry:
 
         del self._tools[tool_name]
         del self._definitions[tool_name]
+        del self._openai_tools[tool_name]
         logger.info(f"Unregistered tool: {tool_name}")
 
     def get(self, tool_name: str) -> BaseTool | Callable:
@@ -156,10 +161,13 @@ class ToolRegistry:
     def get_openai_tools(self) -> list[dict]:
         """Get all tools formatted for OpenAI function calling.
 
+        The dicts are built when each tool is registered and shared between
+        calls, so callers should treat them as read-only.
+
         Returns:
             List of tool definitions in OpenAI format
         """
-        return [definition.to_openai_tool() for definition in self._definitions.values()]
+        return list(self._openai_tools.values())
 
     def has_tool(self, tool_name: str) -> bool:
         """Check if a tool is registered.
@@ -176,6 +184,7 @@ class ToolRegistry:
         """Clear all registered tools."""
         self._tools.clear()
         self._definitions.clear()
+        self._openai_tools.clear()
         logger.info("Cleared all tools from registry")
 
     def __len__(self) -> int:
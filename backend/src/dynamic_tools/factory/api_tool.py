@@ -54,7 +54,25 @@ class GenericApiTool:
     async def execute(self, **kwargs: Any) -> dict:
         """Execute the API tool with given arguments.
         
+        Opens a client for this call only; use execute_with_client to share one.
+        
+        Args:
+            **kwargs: Tool input arguments matching input_schema
+            
+        Returns:
+            Dict matching output_schema
+        """
+        async with httpx.AsyncClient(timeout=self.config.api.timeout) as client:
+            return await self.execute_with_client(client, **kwargs)
+    
+    async def execute_with_client(self, client: httpx.AsyncClient, /, **kwargs: Any) -> dict:
+        """Execute the API tool, sending the request through the given client.
+        
+        Lets a caller such as ToolExecutor share one pooled client across
+        calls instead of opening a connection per call.
+        
         Args:
+            client: Client to send the request with
             **kwargs: Tool input arguments matching input_schema
             
         Returns:
@@ -69,9 +87,8 @@ class GenericApiTool:
         body = self._build_body(kwargs)
         
         # Make the HTTP request
-        async with httpx.AsyncClient(timeout=self.config.api.timeout) as client:
-            response = await self._make_request(client, url, headers, params, body)
-            
+        response = await self._make_request(client, url, headers, params, body)
+        
         # Transform response to output format
         output = self._transform_response(response)
         
@@ -142,17 +159,19 @@ class GenericApiTool:
     ) -> dict:
         """Make the HTTP request."""
         method = self.config.api.method
+        # Per request, since a shared client may serve tools with other timeouts
+        timeout = self.config.api.timeout
         
         if method == HttpMethod.GET:
-            response = await client.get(url, headers=headers, params=params)
+            response = await client.get(url, headers=headers, params=params, timeout=timeout)
         elif method == HttpMethod.POST:
-            response = await client.post(url, headers=headers, params=params, json=body)
+            response = await client.post(url, headers=headers, params=params, json=body, timeout=timeout)
         elif method == HttpMethod.PUT:
-            response = await client.put(url, headers=headers, params=params, json=body)
+            response = await client.put(url, headers=headers, params=params, json=body, timeout=timeout)
         elif method == HttpMethod.PATCH:
-            response = await client.patch(url, headers=headers, params=params, json=body)
+            response = await client.patch(url, headers=headers, params=params, json=body, timeout=timeout)
         elif method == HttpMethod.DELETE:
-            response = await client.delete(url, headers=headers, params=params)
+            response = await client.delete(url, headers=headers, params=params, timeout=timeout)
         else:
             raise ValueError(f"Unsupported HTTP method: {method}")
         
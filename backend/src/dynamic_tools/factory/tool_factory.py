@@ -2,12 +2,39 @@
 
 from __future__ import annotations
 
+import json
+import os
+from functools import lru_cache
+
+from pydantic import TypeAdapter
+
 from ..models.tool_config import ToolConfig
 from .api_tool import GenericApiTool
 from ..core.base import ToolDefinition
 from ..core.registry import ToolRegistry
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+# Built once so create_from_dict validates without unpacking into **kwargs
+_TOOL_CONFIG_ADAPTER = TypeAdapter(ToolConfig)
+
+
+@lru_cache(maxsize=256)
+def _load_tool_config(file_path: str, mtime_ns: int) -> ToolConfig:
+    """Read and validate a JSON tool config file.
+    
+    Keyed on the file's modification time as well as its path, so an edited
+    file is parsed again while unchanged files come straight from the cache.
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    config_dict = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return _TOOL_CONFIG_ADAPTER.validate_python(config_dict)
+
 
 class ToolFactory:
     """Factory for creating tools from configuration."""
@@ -26,16 +53,19 @@ class ToolFactory:
         return GenericApiTool(config)
     
     @staticmethod
-    def create_from_dict(config_dict: dict) -> GenericApiTool:
+    def create_from_dict(config_dict: dict | ToolConfig) -> GenericApiTool:
         """Create a tool from a dictionary configuration.
         
         Args:
-            config_dict: Dictionary matching ToolConfig schema
+            config_dict: Dictionary matching ToolConfig schema, or an
+                already-validated ToolConfig (used as-is)
             
         Returns:
             GenericApiTool instance
         """
-        config = ToolConfig(**config_dict)
+        if isinstance(config_dict, ToolConfig):
+            return ToolFactory.create_from_config(config_dict)
+        config = _TOOL_CONFIG_ADAPTER.validate_python(config_dict)
         return ToolFactory.create_from_config(config)
     
     @staticmethod
@@ -48,10 +78,9 @@ class ToolFactory:
         Returns:
             GenericApiTool instance
         """
-        import json
-        with open(file_path, 'r') as f:
-            config_dict = json.load(f)
-        return ToolFactory.create_from_dict(config_dict)
+        config = _load_tool_config(file_path, os.stat(file_path).st_mtime_ns)
+        # The cached config is shared, so each tool gets its own copy to modify
+        return ToolFactory.create_from_config(config.model_copy(deep=True))
     
     @staticmethod
     async def create_from_supabase(tool_version_id: str) -> GenericApiTool:
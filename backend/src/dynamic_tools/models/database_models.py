@@ -6,7 +6,24 @@ These models represent the database schema and are used for API requests/respons
 from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+# Lengths of the string forms UUID validation accepts: bare hex, hyphenated,
+# braced and urn:uuid:
+_UUID_STR_LENGTHS = frozenset({32, 36, 38, 45})
+
+
+def _precheck_uuid_strings(value):
+    """Reject tool ID strings that cannot be UUIDs before full parsing.
+    
+    Only the length is checked here; anything that passes still goes
+    through Pydantic's UUID validation.
+    """
+    if isinstance(value, list):
+        for item in value:
+            if isinstance(item, str) and len(item) not in _UUID_STR_LENGTHS:
+                raise ValueError(f"'{item[:64]}' is not a valid UUID")
+    return value
 
 
 # ============================================================================
@@ -56,6 +73,12 @@ class MCPConfigBase(BaseModel):
     instruction: Optional[str] = None
     selected_tool_ids: List[UUID] = Field(default_factory=list)
 
+    @field_validator("selected_tool_ids", mode="before")
+    @classmethod
+    def precheck_selected_tool_ids(cls, v):
+        """Fail fast on tool IDs that are obviously not UUIDs."""
+        return _precheck_uuid_strings(v)
+
 
 class MCPConfigCreate(MCPConfigBase):
     """Model for creating a new MCP config."""
@@ -77,6 +100,12 @@ class MCPConfigUpdate(BaseModel):
     )
     deployment_url: Optional[str] = None
 
+    @field_validator("selected_tool_ids", mode="before")
+    @classmethod
+    def precheck_selected_tool_ids(cls, v):
+        """Fail fast on tool IDs that are obviously not UUIDs."""
+        return _precheck_uuid_strings(v)
+
 
 class MCPConfig(MCPConfigBase):
     """Complete MCP config model with all fields."""
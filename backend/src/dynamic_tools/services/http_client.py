@@ -1,5 +1,6 @@
 """HTTP client service for executing HTTP requests."""
 
+import json
 import time
 from typing import Optional
 import httpx
@@ -8,6 +9,36 @@ from loguru import logger
 
 from ..models.http_spec import HTTPRequestSpec, HTTPResponseSpec
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+def _encode_json_body(body: dict) -> bytes:
+    """Encode a request body as compact UTF-8 JSON bytes.
+    
+    Uses orjson when installed, which writes bytes directly; otherwise the
+    stdlib encoder with the same compact settings httpx uses for ``json=``.
+    Both write the same bytes for plain JSON data. Where they differ:
+    
+    - NaN and infinity become ``null`` with orjson; the stdlib encoder
+      raises ValueError.
+    - orjson rejects integers wider than 64 bits, so those bodies fall back
+      to the stdlib encoder.
+    - orjson also accepts keys (and values) such as UUIDs and datetimes;
+      the stdlib encoder only converts int, float, bool and None keys to
+      strings and raises TypeError for anything else.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(body, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass  # e.g. a too-wide integer; the stdlib encoder re-raises real errors
+    return json.dumps(
+        body, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+    ).encode("utf-8")
+
 
 class HTTPClientService:
     """Service for executing HTTP requests from HTTPRequestSpec.
@@ -20,22 +51,56 @@ class HTTPClientService:
     - Automatic retry on transient failures (5xx errors)
     - Response time tracking
     
+    Requests share one pooled httpx.AsyncClient, so connections are reused
+    across calls; close it with aclose() or by using the service as an
+    async context manager.
+    
     Attributes:
         timeout: Request timeout in seconds
         max_retries: Maximum number of retry attempts for failed requests
     """
     
-    def __init__(self, timeout: float = 30.0, max_retries: int = 3):
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
         """Initialize the HTTP client service.
         
         Args:
             timeout: Request timeout in seconds (default: 30.0)
             max_retries: Maximum number of retry attempts (default: 3)
+            client: Optional client to send requests through. When omitted,
+                the service creates its own pooled client on first use.
         """
         self.timeout = timeout
         self.max_retries = max_retries
+        self._client = client
+        self._owns_client = client is None
         logger.info(f"HTTPClientService initialized with timeout={timeout}s, max_retries={max_retries}")
     
+    async def __aenter__(self) -> "HTTPClientService":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the HTTP client if the service created it."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating the service's own if needed."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                timeout=self.timeout,
+            )
+        return self._client
+    
     def _should_retry(self, exception: Exception) -> bool:
         """Determine if request should be retried based on exception.
         
@@ -121,18 +186,17 @@ class HTTPClientService:
         
         logger.info(f"Executing HTTP request: {spec.method} {spec.url}")
         
-        # Prepare request parameters
-        headers = spec.headers or {}
+        # Prepare request parameters (copy so the spec itself is not mutated)
+        headers = dict(spec.headers) if spec.headers else {}
         params = spec.query_params or {}
         
         # Prepare request body
-        json_data = None
         content = None
         
         if spec.body is not None:
-            # If body is dict, send as JSON
+            # If body is dict, encode it as JSON once so retries resend the same bytes
             if isinstance(spec.body, dict):
-                json_data = spec.body
+                content = _encode_json_body(spec.body)
                 if "Content-Type" not in headers and "content-type" not in headers:
                     headers["Content-Type"] = "application/json"
             else:
@@ -140,50 +204,50 @@ class HTTPClientService:
                 content = str(spec.body).encode() if not isinstance(spec.body, bytes) else spec.body
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Execute request with retry logic
-                response = await self._execute_with_retry(
-                    client=client,
-                    method=spec.method,
-                    url=spec.url,
-                    headers=headers,
-                    params=params,
-                    json=json_data,
-                    content=content
-                )
-                
-                # Calculate execution time
-                execution_time_ms = (time.time() - start_time) * 1000
-                
-                # Parse response body
+            # Execute request with retry logic; the timeout is passed per
+            # request so an injected client still honours this service's
+            response = await self._execute_with_retry(
+                client=self._get_client(),
+                method=spec.method,
+                url=spec.url,
+                headers=headers,
+                params=params,
+                content=content,
+                timeout=self.timeout
+            )
+            
+            # Calculate execution time
+            execution_time_ms = (time.time() - start_time) * 1000
+            
+            # Parse response body
+            response_body = None
+            content_type = response.headers.get("content-type", "")
+            
+            if response.status_code == 204:
+                # No content
                 response_body = None
-                content_type = response.headers.get("content-type", "")
-                
-                if response.status_code == 204:
-                    # No content
-                    response_body = None
-                elif "application/json" in content_type:
-                    try:
-                        response_body = response.json()
-                    except Exception:
-                        response_body = response.text
-                elif response.text:
+            elif "application/json" in content_type:
+                try:
+                    response_body = response.json()
+                except Exception:
                     response_body = response.text
-                else:
-                    response_body = None
-                
-                # Convert headers to dict
-                response_headers = dict(response.headers)
-                
-                logger.info(f"HTTP request completed: {response.status_code} in {execution_time_ms:.2f}ms")
-                
-                return HTTPResponseSpec(
-                    status_code=response.status_code,
-                    headers=response_headers,
-                    body=response_body,
-                    execution_time_ms=execution_time_ms
-                )
-                
+            elif response.text:
+                response_body = response.text
+            else:
+                response_body = None
+            
+            # Convert headers to dict
+            response_headers = dict(response.headers)
+            
+            logger.info(f"HTTP request completed: {response.status_code} in {execution_time_ms:.2f}ms")
+            
+            return HTTPResponseSpec(
+                status_code=response.status_code,
+                headers=response_headers,
+                body=response_body,
+                execution_time_ms=execution_time_ms
+            )
+            
         except httpx.TimeoutException as e:
             execution_time_ms = (time.time() - start_time) * 1000
             logger.error(f"HTTP request timed out after {execution_time_ms:.2f}ms")
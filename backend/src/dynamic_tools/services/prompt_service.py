@@ -42,6 +42,11 @@ class PromptService:
         self.max_retries = max_retries
         logger.info("PromptService initialized")
     
+    async def aclose(self) -> None:
+        """Close the OpenAI client and the orchestrator's HTTP client."""
+        await self.orchestrator.aclose()
+        await self.client.close()
+    
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
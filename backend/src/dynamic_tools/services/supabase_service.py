@@ -3,9 +3,11 @@
 This service handles all database interactions with Supabase.
 """
 
+import asyncio
 from typing import List, Optional
 from uuid import UUID
-from supabase import create_client, Client
+import httpx
+from supabase import create_client, Client, ClientOptions
 from loguru import logger
 
 from ..models.database_models import (
@@ -22,16 +24,46 @@ from ..models.database_models import (
 class SupabaseService:
     """Service for interacting with Supabase database."""
     
-    def __init__(self, supabase_url: str, supabase_key: str):
+    def __init__(
+        self,
+        supabase_url: str,
+        supabase_key: str,
+        pool_min: int = 2,
+        pool_max: int = 10,
+        timeout: float = 30.0,
+    ):
         """Initialize Supabase client.
         
+        Requests go through one pooled HTTP client, so connections (and their
+        TLS handshakes) are reused across queries instead of set up per call.
+        
         Args:
             supabase_url: Supabase project URL
             supabase_key: Supabase API key
+            pool_min: Idle connections kept open for reuse
+            pool_max: Maximum open connections
+            timeout: Request timeout in seconds
         """
-        self.client: Client = create_client(supabase_url, supabase_key)
+        self._http_client = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=pool_max,
+                max_keepalive_connections=pool_min,
+            ),
+            timeout=timeout,
+            follow_redirects=True,
+            http2=True,
+        )
+        self.client: Client = create_client(
+            supabase_url,
+            supabase_key,
+            options=ClientOptions(httpx_client=self._http_client),
+        )
         logger.info("SupabaseService initialized")
     
+    def close(self) -> None:
+        """Close the pooled HTTP client and its connections."""
+        self._http_client.close()
+    
     # ========================================================================
     # Projects
     # ========================================================================
@@ -102,12 +134,15 @@ class SupabaseService:
             if not project:
                 return None
             
-            # Fetch all related entities
-            tools = await self.get_tools(project_id)
-            prompts = await self.get_prompts(project_id)
-            flows = await self.get_flows(project_id)
-            mcp_configs = await self.get_mcp_configs(project_id)
-            response_configs = await self.get_response_configs(project_id)
+            # Each getter runs its blocking query in a worker thread, so the
+            # five queries overlap instead of running one after another
+            tools, prompts, flows, mcp_configs, response_configs = await asyncio.gather(
+                self.get_tools(project_id),
+                self.get_prompts(project_id),
+                self.get_flows(project_id),
+                self.get_mcp_configs(project_id),
+                self.get_response_configs(project_id),
+            )
             
             return ProjectWithData(
                 **project.model_dump(),
@@ -128,7 +163,8 @@ class SupabaseService:
     async def get_mcp_configs(self, project_id: UUID) -> List[MCPConfig]:
         """Get all MCP configs for a project."""
         try:
-            result = self.client.table('mcp_configs').select('*').eq('project_id', str(project_id)).execute()
+            query = self.client.table('mcp_configs').select('*').eq('project_id', str(project_id))
+            result = await asyncio.to_thread(query.execute)
             return [MCPConfig(**config) for config in result.data]
         except Exception as e:
             logger.error(f"Error fetching MCP configs: {e}")
@@ -187,7 +223,8 @@ class SupabaseService:
     async def get_response_configs(self, project_id: UUID) -> List[ResponseConfig]:
         """Get all response configs for a project."""
         try:
-            result = self.client.table('response_configs').select('*').eq('project_id', str(project_id)).execute()
+            query = self.client.table('response_configs').select('*').eq('project_id', str(project_id))
+            result = await asyncio.to_thread(query.execute)
             return [ResponseConfig(**config) for config in result.data]
         except Exception as e:
             logger.error(f"Error fetching response configs: {e}")
@@ -246,7 +283,7 @@ class SupabaseService:
             if project_id:
                 query = query.eq('project_id', str(project_id))
             
-            result = query.execute()
+            result = await asyncio.to_thread(query.execute)
             return [Tool(**tool) for tool in result.data]
         except Exception as e:
             logger.error(f"Error fetching tools: {e}")
@@ -308,7 +345,7 @@ class SupabaseService:
             if project_id:
                 query = query.eq('project_id', str(project_id))
             
-            result = query.execute()
+            result = await asyncio.to_thread(query.execute)
             return [Prompt(**prompt) for prompt in result.data]
         except Exception as e:
             logger.error(f"Error fetching prompts: {e}")
@@ -370,7 +407,7 @@ class SupabaseService:
             if project_id:
                 query = query.eq('project_id', str(project_id))
             
-            result = query.execute()
+            result = await asyncio.to_thread(query.execute)
             return [Flow(**flow) for flow in result.data]
         except Exception as e:
             logger.error(f"Error fetching flows: {e}")
@@ -1,16 +1,38 @@
 """Workflow orchestrator for complete MCP workflow execution."""
 
+import asyncio
 from typing import Optional
 from loguru import logger
 
 from ..core.registry import ToolRegistry
-from ..models.api_requests import WorkflowRequest, WorkflowResponse
+from ..models.api_requests import (
+    MCPPromptRequest,
+    PromptRequest,
+    WorkflowRequest,
+    WorkflowResponse,
+)
 from ..models.http_spec import HTTPRequestSpec
 from ..models.tool_config import ToolConfig
 from .prompt_service import PromptService
 from .http_client import HTTPClientService
 
 
+# Tool context templates, compiled once at import time. Each entry is a single
+# format() call producing the same lines the context has always contained.
+_RULE = "=" * 60
+_TOOL_HEADER_TPL = "\n" + _RULE + "\nTool: {name}\nDescription: {description}"
+_API_ENDPOINT_TPL = (
+    "\n**EXACT API ENDPOINT (USE THIS EXACT URL):**\n"
+    "  Base URL: {base_url}\n"
+    "  Path: {path}\n"
+    "  **FULL URL TO USE: {full_url}**\n"
+    "  HTTP Method: {method}"
+)
+_PARAM_LINE_TPL = "  - {name} ({type}){marker}: {description}"
+_OUTPUT_LINE_TPL = "  - {name} ({type})"
+_FALLBACK_TPL = "\nTool: {name}\nDescription: {description}\n(Details unavailable)"
+
+
 class WorkflowOrchestrator:
     """Orchestrates the complete MCP workflow from request to response.
     
@@ -88,7 +110,9 @@ class WorkflowOrchestrator:
         
         # Stage 2: Generate tool context
         try:
-            tools_context = self._format_tools_as_context(found_tools)
+            tools_context = await asyncio.to_thread(
+                self._format_tools_as_context, found_tools
+            )
             logger.debug(f"Generated tool context: {len(tools_context)} characters")
             
         except Exception as e:
@@ -101,8 +125,6 @@ class WorkflowOrchestrator:
         
         # Stage 3: LLM tool selection and HTTP spec generation
         try:
-            from ..models.api_requests import MCPPromptRequest
-            
             mcp_request = MCPPromptRequest(
                 instructions=request.user_instructions,
                 api_docs=tools_context
@@ -116,10 +138,14 @@ class WorkflowOrchestrator:
             
             # Parse HTTP spec from response
             http_spec = HTTPRequestSpec(**prompt_response.content)
-            logger.info(f"LLM generated HTTP spec: {http_spec.method} {http_spec.url}")
+            http_spec_dump = http_spec.model_dump(mode="json")
+            request_line = f"{http_spec.method} {http_spec.url}"
+            logger.info(f"LLM generated HTTP spec: {request_line}")
             
             # Determine which tool was selected
-            selected_tool_name = self._extract_tool_name_from_spec(http_spec, found_tools)
+            selected_tool_name = self._extract_tool_name_from_spec(
+                http_spec, found_tools, url_lower=http_spec_dump["url"].lower()
+            )
             logger.info(f"Identified selected tool: {selected_tool_name}")
             
         except Exception as e:
@@ -132,8 +158,9 @@ class WorkflowOrchestrator:
         
         # Stage 4: Execute API call
         try:
-            logger.info(f"Executing API call: {http_spec.method} {http_spec.url}")
+            logger.info(f"Executing API call: {request_line}")
             response_spec = await self.http_client.execute(http_spec)
+            response_spec_dump = response_spec.model_dump(mode="json")
             logger.info(f"API call completed: {response_spec.status_code}")
             
         except Exception as e:
@@ -148,8 +175,6 @@ class WorkflowOrchestrator:
         formatted_response = None
         if request.format_response:
             try:
-                from ..models.api_requests import PromptRequest
-                
                 # Prepare context for formatting
                 raw_response_str = str(response_spec.body) if response_spec.body else "No response body"
                 
@@ -174,8 +199,8 @@ class WorkflowOrchestrator:
         return WorkflowResponse(
             status="success",
             selected_tool=selected_tool_name,
-            http_spec=http_spec.model_dump(),
-            raw_response=response_spec.model_dump(),
+            http_spec=http_spec_dump,
+            raw_response=response_spec_dump,
             formatted_response=formatted_response
         )
     
@@ -230,20 +255,22 @@ class WorkflowOrchestrator:
             try:
                 tool_def = self.tool_registry.get_definition(tool.name)
                 
-                context_parts.append(f"\n{'='*60}")
-                context_parts.append(f"Tool: {tool_def.name}")
-                context_parts.append(f"Description: {tool_def.description}")
+                context_parts.append(
+                    _TOOL_HEADER_TPL.format(name=tool_def.name, description=tool_def.description)
+                )
                 
                 # **CRITICAL: Include EXACT API endpoint information**
                 # This prevents the LLM from hallucinating URLs
                 if hasattr(tool, 'config') and hasattr(tool.config, 'api'):
                     api_config = tool.config.api
-                    context_parts.append(f"\n**EXACT API ENDPOINT (USE THIS EXACT URL):**")
-                    context_parts.append(f"  Base URL: {api_config.base_url}")
-                    context_parts.append(f"  Path: {api_config.path if api_config.path else '(no additional path)'}")
-                    full_url = f"{api_config.base_url}{api_config.path if api_config.path else ''}"
-                    context_parts.append(f"  **FULL URL TO USE: {full_url}**")
-                    context_parts.append(f"  HTTP Method: {api_config.method}")
+                    context_parts.append(
+                        _API_ENDPOINT_TPL.format(
+                            base_url=api_config.base_url,
+                            path=api_config.path if api_config.path else '(no additional path)',
+                            full_url=f"{api_config.base_url}{api_config.path if api_config.path else ''}",
+                            method=api_config.method,
+                        )
+                    )
                     
                     # Include auth requirements
                     if api_config.auth and api_config.auth.method != "none":
@@ -260,27 +287,32 @@ class WorkflowOrchestrator:
                 # Format input schema
                 if tool_def.input_schema and "properties" in tool_def.input_schema:
                     context_parts.append("\nRequired Parameters:")
+                    required_params = tool_def.input_schema.get("required", [])
                     for param_name, param_info in tool_def.input_schema.get("properties", {}).items():
-                        param_type = param_info.get("type", "any")
-                        param_desc = param_info.get("description", "No description")
-                        required = param_name in tool_def.input_schema.get("required", [])
-                        req_marker = " (required)" if required else " (optional)"
-                        context_parts.append(f"  - {param_name} ({param_type}){req_marker}: {param_desc}")
+                        context_parts.append(
+                            _PARAM_LINE_TPL.format(
+                                name=param_name,
+                                type=param_info.get("type", "any"),
+                                marker=" (required)" if param_name in required_params else " (optional)",
+                                description=param_info.get("description", "No description"),
+                            )
+                        )
                 
                 # Format output schema
                 if tool_def.output_schema and "properties" in tool_def.output_schema:
                     context_parts.append("\nExpected Output:")
                     for output_name, output_info in tool_def.output_schema.get("properties", {}).items():
-                        output_type = output_info.get("type", "any")
-                        context_parts.append(f"  - {output_name} ({output_type})")
+                        context_parts.append(
+                            _OUTPUT_LINE_TPL.format(name=output_name, type=output_info.get("type", "any"))
+                        )
                 
-                context_parts.append(f"{'='*60}")
+                context_parts.append(_RULE)
                 
             except Exception as e:
                 logger.warning(f"Error formatting tool {tool.name}: {e}")
-                context_parts.append(f"\nTool: {tool.name}")
-                context_parts.append(f"Description: {tool.description}")
-                context_parts.append("(Details unavailable)")
+                context_parts.append(
+                    _FALLBACK_TPL.format(name=tool.name, description=tool.description)
+                )
         
         formatted_context = "\n".join(context_parts)
         logger.debug(f"Generated context with {len(formatted_context)} characters")
@@ -290,7 +322,8 @@ class WorkflowOrchestrator:
     def _extract_tool_name_from_spec(
         self,
         http_spec: HTTPRequestSpec,
-        tools: list
+        tools: list,
+        url_lower: Optional[str] = None
     ) -> str:
         """Determine which tool was selected by matching URL/endpoint.
         
@@ -301,6 +334,7 @@ class WorkflowOrchestrator:
         Args:
             http_spec: Generated HTTP request specification
             tools: List of available tool objects
+            url_lower: Lowercased request URL, if the caller already has it
             
         Returns:
             Name of the matched tool, or "unknown" if no match found
@@ -309,11 +343,17 @@ class WorkflowOrchestrator:
             logger.warning("No tools provided for matching")
             return "unknown"
         
+        # If only one tool available, assume it was selected
+        if len(tools) == 1:
+            logger.info(f"Only one tool available, selecting: {tools[0].name}")
+            return tools[0].name
+        
         logger.debug(f"Attempting to match HTTP spec to one of {len(tools)} tools")
         logger.debug(f"HTTP spec URL: {http_spec.url}")
         
         # Strategy 1: Check if tool name appears in the URL
-        url_lower = http_spec.url.lower()
+        if url_lower is None:
+            url_lower = http_spec.url.lower()
         for tool in tools:
             tool_name_parts = tool.name.lower().replace("_", " ").split()
             # Check if any significant part of the tool name is in the URL
@@ -322,16 +362,12 @@ class WorkflowOrchestrator:
                     logger.info(f"Matched tool '{tool.name}' via URL keyword '{part}'")
                     return tool.name
         
-        # Strategy 2: If only one tool available, assume it was selected
-        if len(tools) == 1:
-            logger.info(f"Only one tool available, selecting: {tools[0].name}")
-            return tools[0].name
-        
-        # Strategy 3: Check tool descriptions for URL patterns
+        # Strategy 2: Check tool descriptions for URL patterns
         # (This would require tools to have metadata about their endpoints)
         
-        # Strategy 4: Default to first tool if no match found
+        # Strategy 3: Default to first tool if no match found
         # This is a fallback - in production, we might want to return "unknown"
         # or ask the LLM to clarify
         logger.warning(f"Could not definitively match tool, defaulting to first: {tools[0].name}")
         return tools[0].name
+
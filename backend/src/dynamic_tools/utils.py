@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import functools
-from typing import Any, Callable, TypeVar
+import inspect
+import sys
+from typing import Any, Awaitable, Callable, Coroutine, Iterable, TypeVar
 from tenacity import (
+    RetryCallState,
     retry,
     stop_after_attempt,
     wait_exponential,
@@ -14,56 +18,112 @@ from loguru import logger
 
 from .core.base import ToolConfig, ToolExecutionError, ToolValidationError
 
+try:
+    import uvloop
+except ImportError:  # optional speedup
+    uvloop = None
+
 F = TypeVar("F", bound=Callable[..., Any])
+T = TypeVar("T")
+
+# Exceptions that are worth retrying
+_RETRY_EXC = (ToolExecutionError, ConnectionError, TimeoutError)
+
+
+def _log_before_sleep(retry_state: RetryCallState) -> None:
+    """Log a retry attempt before tenacity sleeps."""
+    max_attempts = retry_state.retry_object.stop.max_attempt_number
+    logger.warning(
+        f"Retrying {retry_state.fn.__name__} (attempt {retry_state.attempt_number}/{max_attempts})"
+    )
 
 
 def with_retry(config: ToolConfig) -> Callable[[F], F]:
     """Decorator to add retry logic to tool execution.
 
+    Sync and async functions retry the same way: the n-th wait is
+    ``retry_delay * backoff_factor ** (n - 1)`` seconds, and once the
+    attempts run out the last exception is re-raised as is.
+
     Args:
         config: ToolConfig with retry settings
 
     Returns:
         Decorated function with retry logic
     """
+    max_wait = config.retry_delay * (config.backoff_factor ** config.max_retries)
+    retry_kwargs = dict(
+        stop=stop_after_attempt(config.max_retries + 1),
+        wait=wait_exponential(
+            multiplier=config.retry_delay,
+            exp_base=config.backoff_factor,
+            max=max_wait,
+        ),
+        retry=retry_if_exception_type(_RETRY_EXC),
+        before_sleep=_log_before_sleep,
+        reraise=True,
+    )
 
     def decorator(func: F) -> F:
-        @retry(
-            stop=stop_after_attempt(config.max_retries + 1),
-            wait=wait_exponential(
-                multiplier=config.retry_delay,
-                max=config.retry_delay * (config.backoff_factor ** config.max_retries),
-            ),
-            retry=retry_if_exception_type((ToolExecutionError, ConnectionError, TimeoutError)),
-            before_sleep=lambda retry_state: logger.warning(
-                f"Retrying {func.__name__} (attempt {retry_state.attempt_number}/{config.max_retries + 1})"
-            ),
-        )
-        @functools.wraps(func)
-        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            return await func(*args, **kwargs)
-
-        @retry(
-            stop=stop_after_attempt(config.max_retries + 1),
-            wait=wait_exponential(
-                multiplier=config.retry_delay,
-                max=config.retry_delay * (config.backoff_factor ** config.max_retries),
-            ),
-            retry=retry_if_exception_type((ToolExecutionError, ConnectionError, TimeoutError)),
-            before_sleep=lambda retry_state: logger.warning(
-                f"Retrying {func.__name__} (attempt {retry_state.attempt_number}/{config.max_retries + 1})"
-            ),
-        )
+        # Async path uses a plain loop so the no-retry case stays cheap
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                for attempt in range(config.max_retries + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except _RETRY_EXC:
+                        if attempt == config.max_retries:
+                            raise
+                    logger.warning(
+                        f"Retrying {func.__name__} (attempt {attempt + 1}/{config.max_retries + 1})"
+                    )
+                    await asyncio.sleep(
+                        min(config.retry_delay * config.backoff_factor ** attempt, max_wait)
+                    )
+
+            return async_wrapper  # type: ignore
+
         @functools.wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
             return func(*args, **kwargs)
 
-        # Return appropriate wrapper based on function type
-        import inspect
-
-        if inspect.iscoroutinefunction(func):
-            return async_wrapper  # type: ignore
-        else:
-            return sync_wrapper  # type: ignore
+        return retry(**retry_kwargs)(sync_wrapper)  # type: ignore
 
     return decorator
+
+
+async def gather_bounded(aws: Iterable[Awaitable[T]], limit: int = 8) -> list[T]:
+    """Await many awaitables concurrently with at most ``limit`` in flight.
+
+    Args:
+        aws: Awaitables to run
+        limit: Maximum number running at the same time
+
+    Returns:
+        Results in the same order as ``aws``
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _bounded(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(_bounded(aw) for aw in aws))
+
+
+def run_async(main: Coroutine[Any, Any, T]) -> T:
+    """Run a script's main coroutine, on uvloop when it can be used.
+
+    uvloop is used when it is installed and asyncio.run takes a
+    ``loop_factory`` (Python 3.12+); otherwise this is plain asyncio.run.
+
+    Args:
+        main: Coroutine to run to completion
+
+    Returns:
+        The coroutine's result
+    """
+    if uvloop is not None and sys.version_info >= (3, 12):
+        return asyncio.run(main, loop_factory=uvloop.new_event_loop)
+    return asyncio.run(main)
@@ -1,18 +1,108 @@
 """Pytest configuration and shared fixtures."""
 
+from types import MappingProxyType
+from unittest.mock import patch
+
 import pytest
-from fastapi.testclient import TestClient
-from dynamic_tools.api.app import app
+import pytest_asyncio
 
 
-@pytest.fixture
-def client():
-    """FastAPI test client fixture.
+@pytest.fixture(scope="session")
+def app_settings():
+    """Settings the app's endpoints receive for the whole session.
     
-    Returns:
+    The endpoints take Settings as a dependency, and building it for real
+    needs Supabase credentials from the environment or a .env file. The
+    dependency is overridden with placeholder credentials, so the suite runs
+    without secrets.
+    
+    Yields:
+        Settings instance served to the endpoints
+    """
+    from dynamic_tools.api.app import app
+    from dynamic_tools.config.settings import Settings, get_settings
+    
+    settings = Settings(_env_file=None, supabase_url="https://test.supabase.co", supabase_key="test-key")
+    app.dependency_overrides[get_settings] = lambda: settings
+    yield settings
+    app.dependency_overrides.pop(get_settings, None)
+
+
+@pytest.fixture(scope="session")
+def client(app_settings):
+    """FastAPI test client fixture, shared by the whole test session.
+    
+    Entering the client runs the app's startup hooks once for the session
+    instead of building a fresh client per test. Supabase's create_client is
+    patched while they run, so loading tools at startup neither builds a real
+    client nor reaches the network. The app is imported here rather than at
+    module level so that test runs which never request a client don't load
+    the whole API stack.
+    
+    Server exceptions are not re-raised into the test: tests only inspect the
+    HTTP response, and FastAPI's exception handlers have already turned
+    HTTPExceptions into JSON error bodies before the client would re-raise.
+    
+    Yields:
         TestClient instance for testing endpoints
     """
-    return TestClient(app)
+    from fastapi.testclient import TestClient
+    from dynamic_tools.api.app import app
+    
+    with patch('dynamic_tools.services.supabase_service.create_client'):
+        with TestClient(app, raise_server_exceptions=False, base_url="http://testserver") as test_client:
+            yield test_client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def aclient(app_settings):
+    """Async HTTP client that calls the app in-process, shared by the session.
+    
+    Requests go straight through ASGITransport on the session event loop,
+    without TestClient's per-request sync-to-async bridging. The transport
+    doesn't run the app's startup hooks; tests that need them use client.
+    Like client, it returns the app's error responses instead of re-raising.
+    
+    Yields:
+        httpx.AsyncClient bound to the app
+    """
+    from httpx import ASGITransport, AsyncClient
+    from dynamic_tools.api.app import app
+    
+    async with AsyncClient(transport=ASGITransport(app=app, raise_app_exceptions=False), base_url="http://test") as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def openapi_schema(aclient):
+    """The app's OpenAPI schema, fetched once for the session.
+    
+    Returns:
+        Parsed /openapi.json document
+    """
+    response = await aclient.get("/openapi.json")
+    response.raise_for_status()
+    return response.json()
+
+
+# Immutable so the fixture can hand out one shared instance; tests that
+# need to modify the response should build their own dict from it.
+_MOCK_OPENAI_RESPONSE = MappingProxyType({
+    "id": "resp_123",
+    "object": "response",
+    "created": 1234567890,
+    "model": "gpt-4o-mini",
+    "choices": (
+        MappingProxyType({
+            "index": 0,
+            "message": MappingProxyType({
+                "role": "assistant",
+                "content": "Test response"
+            }),
+            "finish_reason": "stop"
+        }),
+    )
+})
 
 
 @pytest.fixture
@@ -20,22 +110,6 @@ def mock_openai_response():
     """Mock OpenAI API response for testing.
     
     Returns:
-        Dict representing a typical OpenAI response
+        Read-only mapping representing a typical OpenAI response
     """
-    return {
-        "id": "resp_123",
-        "object": "response",
-        "created": 1234567890,
-        "model": "gpt-4o-mini",
-        "choices": [
-            {
-                "index": 0,
-                "message": {
-                    "role": "assistant",
-                    "content": "Test response"
-                },
-                "finish_reason": "stop"
-            }
-        ]
-    }
-
+    return _MOCK_OPENAI_RESPONSE
@@ -1,24 +1,74 @@
 """Tests for config-based tool creation and execution."""
 
 import pytest
+import pytest_asyncio
 import json
 import os
-from typing import Any
+import re
+import httpx
+from types import MappingProxyType
+from typing import Any, Mapping
+from unittest.mock import MagicMock
+from pytest_httpx import HTTPXMock
 
-# Add src to path
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from dynamic_tools.models.tool_config import ToolConfig
-from dynamic_tools.factory.tool_factory import ToolFactory
+from dynamic_tools.factory.tool_factory import ToolFactory, _TOOL_CONFIG_ADAPTER, _load_tool_config
 from dynamic_tools.core.registry import ToolRegistry
 from dynamic_tools.core.executor import ToolExecutor
+from dynamic_tools.core.orchestrator import AIOrchestrator
 
 
-@pytest.fixture
-def stock_quote_config() -> dict:
-    """Sample stock quote tool configuration."""
-    return {
+_STOCK_QUOTE_INPUT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "symbol": {
+            "type": "string",
+            "description": "Stock ticker symbol (e.g., IBM, AAPL)"
+        }
+    },
+    "required": ["symbol"]
+}
+
+# What the registry should hand OpenAI for the sample tool
+_EXPECTED_OPENAI_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "test_stock_quote",
+        "description": "Get real-time stock quote from Alpha Vantage API",
+        "parameters": _STOCK_QUOTE_INPUT_SCHEMA,
+        "strict": True
+    }
+}
+
+# Canned GLOBAL_QUOTE payload in Alpha Vantage's format (values are strings)
+_GLOBAL_QUOTE_RESPONSE = {
+    "Global Quote": {
+        "01. symbol": "IBM",
+        "05. price": "182.5000",
+        "06. volume": "3141592",
+        "07. latest trading day": "2024-01-05",
+        "09. change": "1.2500",
+        "10. change percent": "0.6896%"
+    }
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _demo_api_key():
+    """Use Alpha Vantage's demo key unless a real one is set."""
+    os.environ.setdefault("ALPHA_VANTAGE_API_KEY", "demo")
+    yield
+
+
+@pytest.fixture(scope="session")
+def stock_quote_config() -> Mapping[str, Any]:
+    """Sample stock quote tool configuration, shared read-only across the session."""
+    return MappingProxyType({
         "name": "test_stock_quote",
         "description": "Get real-time stock quote from Alpha Vantage API",
         "version": 1,
@@ -36,16 +86,7 @@ def stock_quote_config() -> dict:
             },
             "timeout": 30.0
         },
-        "input_schema": {
-            "type": "object",
-            "properties": {
-                "symbol": {
-                    "type": "string",
-                    "description": "Stock ticker symbol (e.g., IBM, AAPL)"
-                }
-            },
-            "required": ["symbol"]
-        },
+        "input_schema": _STOCK_QUOTE_INPUT_SCHEMA,
         "output_schema": {
             "type": "object",
             "properties": {
@@ -73,7 +114,40 @@ def stock_quote_config() -> dict:
             }
         },
         "tags": ["finance", "stocks", "test"]
-    }
+    })
+
+
+@pytest.fixture(scope="session")
+def stock_quote_tool_config(stock_quote_config) -> ToolConfig:
+    """Sample config validated once into a ToolConfig."""
+    return ToolConfig.model_validate(dict(stock_quote_config))
+
+
+@pytest.fixture(scope="session")
+def built_tool(stock_quote_tool_config):
+    """Tool built once from the sample config; tools are stateless so tests share it."""
+    return ToolFactory.create_from_dict(stock_quote_tool_config)
+
+
+@pytest.fixture(scope="session")
+def stock_quote_json_file(tmp_path_factory, stock_quote_config) -> str:
+    """Sample config written to disk once for the tests that load from a file."""
+    path = tmp_path_factory.mktemp("config") / "stock_tool.json"
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(dict(stock_quote_config)))
+    else:
+        path.write_text(json.dumps(dict(stock_quote_config)))
+    return str(path)
+
+
+@pytest.fixture
+def mock_alpha_vantage(httpx_mock: HTTPXMock):
+    """Serve the canned quote for Alpha Vantage requests instead of the real API."""
+    httpx_mock.add_response(
+        url=re.compile(r"https://www\.alphavantage\.co/query\?.*"),
+        json=_GLOBAL_QUOTE_RESPONSE,
+    )
+    return httpx_mock
 
 
 @pytest.fixture
@@ -82,18 +156,30 @@ def registry():
     return ToolRegistry()
 
 
-@pytest.fixture
-def executor(registry):
-    """Tool executor with registry."""
-    return ToolExecutor(registry)
+@pytest.fixture(scope="session")
+def prebuilt_registry(built_tool):
+    """Registry holding the sample tool, shared by tests that only read from it."""
+    registry = ToolRegistry()
+    registry.register(built_tool)
+    return registry
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def executor(registry):
+    """Tool executor with registry, closed after the test."""
+    executor = ToolExecutor(registry)
+    yield executor
+    await executor.aclose()
 
 
 class TestConfigBasedToolCreation:
     """Test creating tools from JSON configuration."""
     
     def test_config_validation(self, stock_quote_config):
-        """Test that config validates correctly."""
-        config = ToolConfig(**stock_quote_config)
+        """Test that config validates correctly through the factory's adapter."""
+        config = _TOOL_CONFIG_ADAPTER.validate_python(stock_quote_config)
+        
+        assert config == ToolConfig(**stock_quote_config)
         
         assert config.name == "test_stock_quote"
         assert config.description == "Get real-time stock quote from Alpha Vantage API"
@@ -110,75 +196,90 @@ class TestConfigBasedToolCreation:
         assert tool.input_schema == stock_quote_config["input_schema"]
         assert tool.output_schema == stock_quote_config["output_schema"]
     
-    def test_tool_creation_from_json_file(self, stock_quote_config, tmp_path):
-        """Test creating tool from JSON file."""
-        # Write config to temp file
-        config_file = tmp_path / "test_tool.json"
-        with open(config_file, 'w') as f:
-            json.dump(stock_quote_config, f)
+    def test_tool_creation_from_validated_config(self, stock_quote_tool_config):
+        """Test that an already-validated ToolConfig is used as-is."""
+        tool = ToolFactory.create_from_dict(stock_quote_tool_config)
         
-        # Create tool from file
-        tool = ToolFactory.create_from_json_file(str(config_file))
+        assert tool.config is stock_quote_tool_config
+    
+    def test_tool_creation_from_json_file(self, stock_quote_json_file):
+        """Test creating tool from JSON file."""
+        tool = ToolFactory.create_from_json_file(stock_quote_json_file)
         
         assert tool.name == "test_stock_quote"
         assert tool.description == "Get real-time stock quote from Alpha Vantage API"
+    
+    def test_json_file_config_is_cached_until_modified(self, stock_quote_config, tmp_path):
+        """Test that an unchanged file is parsed once and an edited one again."""
+        config_file = tmp_path / "cached_tool.json"
+        config_file.write_text(json.dumps(dict(stock_quote_config)))
+        
+        first = ToolFactory.create_from_json_file(str(config_file))
+        hits = _load_tool_config.cache_info().hits
+        second = ToolFactory.create_from_json_file(str(config_file))
+        assert _load_tool_config.cache_info().hits == hits + 1
+        
+        # Each tool gets its own copy, so changing one leaves the other alone
+        assert second.config == first.config
+        second.config.api.headers["X-Edited"] = "yes"
+        assert "X-Edited" not in first.config.api.headers
+        
+        # Bump the mtime explicitly in case the filesystem's clock is coarse
+        mtime_ns = config_file.stat().st_mtime_ns
+        edited = dict(stock_quote_config, description="Edited description")
+        config_file.write_text(json.dumps(edited))
+        os.utime(config_file, ns=(mtime_ns, mtime_ns + 1_000_000))
+        
+        third = ToolFactory.create_from_json_file(str(config_file))
+        assert third.description == "Edited description"
 
 
 class TestConfigBasedToolRegistration:
     """Test registering config-based tools."""
     
-    def test_register_config_tool(self, stock_quote_config, registry):
+    def test_register_config_tool(self, built_tool, registry):
         """Test registering a config-based tool."""
-        tool = ToolFactory.create_from_dict(stock_quote_config)
-        registry.register(tool)
+        registry.register(built_tool)
         
         assert "test_stock_quote" in registry.list_tools()
         assert len(registry) == 1
     
-    def test_get_registered_tool(self, stock_quote_config, registry):
+    def test_get_registered_tool(self, prebuilt_registry):
         """Test retrieving a registered config-based tool."""
-        tool = ToolFactory.create_from_dict(stock_quote_config)
-        registry.register(tool)
-        
-        retrieved_tool = registry.get("test_stock_quote")
+        retrieved_tool = prebuilt_registry.get("test_stock_quote")
         assert retrieved_tool.name == "test_stock_quote"
     
-    def test_get_tool_definition(self, stock_quote_config, registry):
+    def test_get_tool_definition(self, stock_quote_config, prebuilt_registry):
         """Test getting tool definition from registry."""
-        tool = ToolFactory.create_from_dict(stock_quote_config)
-        registry.register(tool)
-        
-        definition = registry.get_definition("test_stock_quote")
+        definition = prebuilt_registry.get_definition("test_stock_quote")
         assert definition.name == "test_stock_quote"
         assert definition.input_schema == stock_quote_config["input_schema"]
     
-    def test_openai_tool_format(self, stock_quote_config, registry):
+    def test_openai_tool_format(self, prebuilt_registry):
         """Test conversion to OpenAI tool format."""
-        tool = ToolFactory.create_from_dict(stock_quote_config)
-        registry.register(tool)
+        openai_tools = prebuilt_registry.get_openai_tools()
         
-        openai_tools = registry.get_openai_tools()
+        assert openai_tools == [_EXPECTED_OPENAI_TOOL]
+    
+    def test_openai_tool_format_is_cached(self, built_tool, registry):
+        """Test that each tool's OpenAI dict is built once at registration."""
+        registry.register(built_tool)
         
-        assert len(openai_tools) == 1
-        assert openai_tools[0]["type"] == "function"
-        assert openai_tools[0]["function"]["name"] == "test_stock_quote"
-        assert openai_tools[0]["function"]["description"] == stock_quote_config["description"]
-        assert openai_tools[0]["function"]["parameters"] == stock_quote_config["input_schema"]
-        assert openai_tools[0]["function"]["strict"] == True
+        assert registry.get_openai_tools()[0] is registry.get_openai_tools()[0]
+        
+        registry.unregister("test_stock_quote")
+        assert registry.get_openai_tools() == []
 
 
 class TestConfigBasedToolExecution:
     """Test executing config-based tools."""
     
-    @pytest.mark.asyncio
-    async def test_execute_config_tool(self, stock_quote_config, registry, executor):
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
+    
+    async def test_execute_config_tool(self, built_tool, registry, executor, mock_alpha_vantage):
         """Test executing a config-based tool."""
-        # Set demo API key for testing
-        os.environ.setdefault("ALPHA_VANTAGE_API_KEY", "demo")
-        
         # Register tool
-        tool = ToolFactory.create_from_dict(stock_quote_config)
-        registry.register(tool)
+        registry.register(built_tool)
         
         # Execute tool
         result = await executor.execute(
@@ -188,19 +289,22 @@ class TestConfigBasedToolExecution:
         
         # Verify result structure
         assert result.tool_name == "test_stock_quote"
-        assert result.success in [True, False]  # May fail with demo key limits
+        assert result.success
         assert result.execution_time_ms >= 0
         
-        if result.success:
-            # Verify output structure if successful
-            assert isinstance(result.data, dict)
-            # Note: data might be empty due to API response structure
+        # Verify output structure
+        assert isinstance(result.data, dict)
+        # Note: data might be empty due to API response structure
+        
+        # Verify the request carried the mapped input and auth params
+        request = mock_alpha_vantage.get_request()
+        assert request.url.params["symbol"] == "IBM"
+        assert request.url.params["function"] == "GLOBAL_QUOTE"
+        assert request.url.params["apikey"] == os.environ["ALPHA_VANTAGE_API_KEY"]
     
-    @pytest.mark.asyncio
-    async def test_tool_input_validation(self, stock_quote_config, registry, executor):
+    async def test_tool_input_validation(self, built_tool, registry, executor, mock_alpha_vantage):
         """Test that tool validates input against schema."""
-        tool = ToolFactory.create_from_dict(stock_quote_config)
-        registry.register(tool)
+        registry.register(built_tool)
         
         # Execute with valid input
         result = await executor.execute(
@@ -210,27 +314,59 @@ class TestConfigBasedToolExecution:
         
         assert result.tool_name == "test_stock_quote"
         # Should not fail on validation
-        if not result.success:
-            # If it fails, should not be a validation error on our side
-            assert "validation error" not in result.error.lower() or "Input" not in result.error
+        assert result.success, result.error
+    
+    async def test_input_validation_model_is_reused(self, built_tool, registry, executor, httpx_mock):
+        """Test that the input validation model is built once per tool, not per call."""
+        httpx_mock.add_response(json=_GLOBAL_QUOTE_RESPONSE, is_reusable=True)
+        registry.register(built_tool)
+        
+        await executor.execute(tool_name="test_stock_quote", arguments={"symbol": "IBM"})
+        first_model = executor._input_models["test_stock_quote"][1]
+        await executor.execute(tool_name="test_stock_quote", arguments={"symbol": "AAPL"})
+        
+        assert executor._input_models["test_stock_quote"][1] is first_model
+    
+    async def test_execute_through_injected_client(self, built_tool, registry):
+        """Test that API tools send requests through the executor's client."""
+        seen = []
+        
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json=_GLOBAL_QUOTE_RESPONSE)
+        
+        registry.register(built_tool)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            executor = ToolExecutor(registry, http_client=client)
+            result = await executor.execute(
+                tool_name="test_stock_quote",
+                arguments={"symbol": "IBM"}
+            )
+            await executor.aclose()
+            assert not client.is_closed
+        
+        assert result.success, result.error
+        assert len(seen) == 1
+        assert seen[0].url.params["symbol"] == "IBM"
+    
+    async def test_orchestrator_aclose_closes_executor_client(self, registry):
+        """Test that closing an orchestrator closes its executor's HTTP client."""
+        async with AIOrchestrator(client=MagicMock(), registry=registry) as orchestrator:
+            http_client = orchestrator.executor._get_http_client()
+        
+        assert http_client.is_closed
 
 
 class TestEndToEndConfigFlow:
     """Test complete end-to-end flow with config-based tools."""
     
-    @pytest.mark.asyncio
-    async def test_complete_flow_from_json(self, stock_quote_config, tmp_path):
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
+    
+    async def test_complete_flow_from_json(self, stock_quote_json_file, mock_alpha_vantage):
         """Test complete flow: JSON → Tool → Registry → Execution."""
-        # Set demo API key
-        os.environ.setdefault("ALPHA_VANTAGE_API_KEY", "demo")
-        
-        # Step 1: Save config to JSON file
-        config_file = tmp_path / "stock_tool.json"
-        with open(config_file, 'w') as f:
-            json.dump(stock_quote_config, f)
-        
+        # Step 1: Config was saved to JSON by the stock_quote_json_file fixture
         # Step 2: Load tool from file
-        tool = ToolFactory.create_from_json_file(str(config_file))
+        tool = ToolFactory.create_from_json_file(stock_quote_json_file)
         assert tool.name == "test_stock_quote"
         
         # Step 3: Register tool
@@ -245,13 +381,17 @@ class TestEndToEndConfigFlow:
         
         # Step 5: Execute tool
         executor = ToolExecutor(registry)
-        result = await executor.execute(
-            tool_name="test_stock_quote",
-            arguments={"symbol": "IBM"}
-        )
+        try:
+            result = await executor.execute(
+                tool_name="test_stock_quote",
+                arguments={"symbol": "IBM"}
+            )
+        finally:
+            await executor.aclose()
         
         # Step 6: Verify execution completed
         assert result.tool_name == "test_stock_quote"
+        assert result.success
         assert isinstance(result.execution_time_ms, float)
         assert result.execution_time_ms >= 0
 
@@ -259,25 +399,21 @@ class TestEndToEndConfigFlow:
 class TestConfigToolProperties:
     """Test specific properties of config-based tools."""
     
-    def test_tool_has_execute_method(self, stock_quote_config):
+    def test_tool_has_execute_method(self, built_tool):
         """Test that GenericApiTool has callable execute method."""
-        tool = ToolFactory.create_from_dict(stock_quote_config)
-        
-        assert hasattr(tool, 'execute')
-        assert callable(tool.execute)
+        assert hasattr(built_tool, 'execute')
+        assert callable(built_tool.execute)
     
-    def test_tool_has_required_properties(self, stock_quote_config):
+    def test_tool_has_required_properties(self, built_tool):
         """Test that tool has all required properties."""
-        tool = ToolFactory.create_from_dict(stock_quote_config)
+        assert hasattr(built_tool, 'name')
+        assert hasattr(built_tool, 'description')
+        assert hasattr(built_tool, 'input_schema')
+        assert hasattr(built_tool, 'output_schema')
         
-        assert hasattr(tool, 'name')
-        assert hasattr(tool, 'description')
-        assert hasattr(tool, 'input_schema')
-        assert hasattr(tool, 'output_schema')
-        
-        assert tool.name == "test_stock_quote"
-        assert isinstance(tool.input_schema, dict)
-        assert isinstance(tool.output_schema, dict)
+        assert built_tool.name == "test_stock_quote"
+        assert isinstance(built_tool.input_schema, dict)
+        assert isinstance(built_tool.output_schema, dict)
 
 
 if __name__ == "__main__":
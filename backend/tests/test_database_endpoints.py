@@ -4,70 +4,186 @@ This test suite validates that API calls properly reach Supabase through
 the Python library with correct data transformations.
 """
 
+import threading
+
 import pytest
+from types import MappingProxyType, SimpleNamespace
 from uuid import uuid4, UUID
-from datetime import datetime
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
-from fastapi.testclient import TestClient
+from unittest.mock import patch
+
+from dynamic_tools.api.database_endpoints import _get_supabase_service, close_cached_services
+from dynamic_tools.services.supabase_service import SupabaseService
+
+
+# Timestamp shared by all mock rows; fixed so rows are identical across runs
+_NOW_ISO = "2024-01-01T00:00:00"
+
+# ID of the stored row in the flow tests
+_FLOW_ID = UUID("11111111-1111-1111-1111-111111111111")
+
+# Row templates without IDs; fixtures and update tests overlay IDs and
+# changed fields with {**template, ...}
+_PROJECT_TEMPLATE = MappingProxyType({
+    'user_id': None,
+    'name': 'Test Project',
+    'description': 'A test project',
+    'created_at': _NOW_ISO,
+    'updated_at': _NOW_ISO
+})
+
+_MCP_CONFIG_TEMPLATE = MappingProxyType({
+    'numeric_id': 1,  # Frontend-compatible numeric ID
+    'name': 'Test MCP Config',
+    'model': 'gpt-4o-mini',
+    'temperature': 0.7,
+    'max_tokens': 1000,
+    'system_prompt': 'You are a helpful assistant',
+    'instruction': 'Answer questions clearly',
+    'selected_tool_ids': (),
+    'deployment_status': 'not-deployed',
+    'deployment_url': None,
+    'deployed_at': None,
+    'created_at': _NOW_ISO,
+    'updated_at': _NOW_ISO
+})
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+class FakeSupabase:
+    """Stand-in for the Supabase client's ``table().<op>().eq().execute()`` chain.
+    
+    ``table()`` starts a _FakeQuery; it and every builder call on it are
+    recorded in ``calls``, so tests can assert on the exact query the service
+    built. Only the builder methods the service uses exist; anything else
+    fails loudly.
+    
+    ``data`` holds the rows every query returns, or a dict of rows per table
+    for methods that query several tables.
+    """
+    
+    __slots__ = ("data", "calls")
+    
+    def __init__(self, data=None):
+        self.data = data
+        self.calls = []
+    
+    def table(self, name):
+        self.calls.append(("table", name))
+        return _FakeQuery(self, name)
+    
+    def calls_to(self, name):
+        """Arguments of each recorded call to one builder method."""
+        return [call[1:] for call in self.calls if call[0] == name]
+
 
-from src.dynamic_tools.api.app import app
-from src.dynamic_tools.models.database_models import (
-    Project, ProjectCreate, ProjectUpdate,
-    MCPConfig, MCPConfigCreate, MCPConfigUpdate,
-    ResponseConfig, ResponseConfigCreate, ResponseConfigUpdate,
-    Tool, ToolCreate, ToolUpdate,
-    Prompt, PromptCreate, PromptUpdate,
-    Flow, FlowCreate, FlowUpdate,
-)
+class _FakeQuery:
+    """One query on a FakeSupabase, so queries run from worker threads don't mix."""
+    
+    __slots__ = ("client", "table_name")
+    
+    def __init__(self, client, table_name):
+        self.client = client
+        self.table_name = table_name
+    
+    def _record(self, name, *args):
+        self.client.calls.append((name, *args))
+        return self
+    
+    def select(self, *columns):
+        return self._record("select", *columns)
+    
+    def insert(self, row):
+        return self._record("insert", row)
+    
+    def update(self, values):
+        return self._record("update", values)
+    
+    def delete(self):
+        return self._record("delete")
+    
+    def eq(self, column, value):
+        return self._record("eq", column, value)
+    
+    def execute(self):
+        """Return the client's rows for this query's table."""
+        data = self.client.data
+        if isinstance(data, dict):
+            data = data.get(self.table_name, [])
+        return SimpleNamespace(data=data)
 
 
 # ============================================================================
 # Fixtures
 # ============================================================================
 
-@pytest.fixture
-def client():
-    """FastAPI test client."""
-    return TestClient(app)
+@pytest.fixture(scope="module")
+def _patched_create_client():
+    """create_client patched once for the module.
+    
+    The patch lives in this worker's process, so it relies on pytest-xdist's
+    loadfile distribution keeping every test in this file on one worker.
+    """
+    with patch('dynamic_tools.services.supabase_service.create_client') as mock:
+        yield mock
 
 
-@pytest.fixture
-def mock_supabase():
-    """Mock Supabase client."""
-    with patch('src.dynamic_tools.services.supabase_service.create_client') as mock:
-        yield mock
+@pytest.fixture(autouse=True)
+def _fresh_supabase_service():
+    """Close and forget the endpoints' cached service around each test.
+    
+    No service, and so no fake client, carries over from one test to the next.
+    """
+    close_cached_services()
+    yield
+    close_cached_services()
 
 
 @pytest.fixture
+def fake_supabase(_patched_create_client):
+    """Fake Supabase client returned by the patched create_client."""
+    fake = FakeSupabase()
+    _patched_create_client.return_value = fake
+    return fake
+
+
+@pytest.fixture(scope="session")
 def project_id():
     """Sample project UUID."""
     return uuid4()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def project_id_str(project_id):
+    """Sample project UUID as the string the API and Supabase see."""
+    return str(project_id)
+
+
+@pytest.fixture(scope="session")
 def tool_id():
     """Sample tool UUID."""
     return uuid4()
 
 
+@pytest.fixture(scope="session")
+def tool_id_str(tool_id):
+    """Sample tool UUID as a string."""
+    return str(tool_id)
+
+
 @pytest.fixture
-def mock_project(project_id):
+def mock_project(project_id_str):
     """Mock project data."""
-    return {
-        'id': str(project_id),
-        'user_id': None,
-        'name': 'Test Project',
-        'description': 'A test project',
-        'created_at': datetime.now().isoformat(),
-        'updated_at': datetime.now().isoformat()
-    }
+    return {**_PROJECT_TEMPLATE, 'id': project_id_str}
 
 
 @pytest.fixture
-def mock_tool(tool_id, project_id):
+def mock_tool(tool_id_str, project_id_str):
     """Mock tool data."""
     return {
-        'id': str(tool_id),
+        'id': tool_id_str,
         'numeric_id': 1,  # Frontend-compatible numeric ID
         'name': 'test_tool',
         'description': 'A test tool',
@@ -83,40 +199,145 @@ def mock_tool(tool_id, project_id):
             'input_schema': {'type': 'object', 'properties': {}},
             'output_schema': {'type': 'object'}
         },
-        'project_id': str(project_id),
+        'project_id': project_id_str,
         'method': 'GET',  # Flattened fields for frontend
         'url': 'https://api.example.com',
         'headers': [],
         'query_params': [],
         'body_config': None,
-        'created_at': datetime.now().isoformat(),
-        'updated_at': datetime.now().isoformat()
+        'created_at': _NOW_ISO,
+        'updated_at': _NOW_ISO
     }
 
 
 @pytest.fixture
-def mock_mcp_config(project_id):
+def mock_mcp_config(project_id_str):
     """Mock MCP config data."""
-    config_id = uuid4()
+    return {**_MCP_CONFIG_TEMPLATE, 'id': str(uuid4()), 'project_id': project_id_str}
+
+
+@pytest.fixture
+def mock_response_config(project_id_str):
+    """Mock response config data."""
+    return {
+        'id': str(uuid4()),
+        'numeric_id': 1,  # Frontend-compatible numeric ID
+        'project_id': project_id_str,
+        'name': 'Test Response Config',
+        'type': 'llm-reprocess',
+        'reprocess_instructions': 'Format as markdown',
+        'error_handling': 'retry',
+        'created_at': _NOW_ISO,
+        'updated_at': _NOW_ISO
+    }
+
+
+@pytest.fixture
+def mock_prompt(project_id_str):
+    """Mock prompt data."""
     return {
-        'id': str(config_id),
+        'id': str(uuid4()),
         'numeric_id': 1,  # Frontend-compatible numeric ID
-        'project_id': str(project_id),
-        'name': 'Test MCP Config',
-        'model': 'gpt-4o-mini',
-        'temperature': 0.7,
-        'max_tokens': 1000,
-        'system_prompt': 'You are a helpful assistant',
-        'instruction': 'Answer questions clearly',
-        'selected_tool_ids': [],
-        'deployment_status': 'not-deployed',
-        'deployment_url': None,
-        'deployed_at': None,
-        'created_at': datetime.now().isoformat(),
-        'updated_at': datetime.now().isoformat()
+        'project_id': project_id_str,
+        'name': 'greeting',
+        'description': 'Greet the user',
+        'prompt_template': 'Hello {{name}}, welcome!',
+        'content': 'Hello {{name}}, welcome!',  # Frontend-compatible content field
+        'variables': ['name'],
+        'created_at': _NOW_ISO,
+        'updated_at': _NOW_ISO
     }
 
 
+# ============================================================================
+# Create Tests
+# ============================================================================
+
+# Resources whose create endpoint is a plain insert: (path, payload builder
+# taking the project ID string, fixture providing the row Supabase returns). MCP
+# configs and flows keep their own tests for their type-specific checks.
+CREATE_CASES = [
+    pytest.param(
+        '/api/projects',
+        lambda project_id_str: {
+            'name': 'Test Project',
+            'description': 'A test project'
+        },
+        'mock_project',
+        id='project',
+    ),
+    pytest.param(
+        '/api/projects/{project_id_str}/tools',
+        lambda project_id_str: {
+            'name': 'test_tool',
+            'description': 'A test tool',
+            'project_id': project_id_str,
+            'tool_config': {
+                'api': {
+                    'base_url': 'https://api.example.com',
+                    'method': 'GET',
+                    'headers': {},
+                    'params': {},
+                    'auth': {'method': 'none'},
+                    'timeout': 30.0
+                },
+                'input_schema': {'type': 'object', 'properties': {}},
+                'output_schema': {'type': 'object'}
+            }
+        },
+        'mock_tool',
+        id='tool',
+    ),
+    pytest.param(
+        '/api/projects/{project_id_str}/response-configs',
+        lambda project_id_str: {
+            'name': 'Test Response Config',
+            'project_id': project_id_str,
+            'type': 'llm-reprocess',
+            'reprocess_instructions': 'Format as markdown',
+            'error_handling': 'retry'
+        },
+        'mock_response_config',
+        id='response_config',
+    ),
+    pytest.param(
+        '/api/projects/{project_id_str}/prompts',
+        lambda project_id_str: {
+            'name': 'greeting',
+            'description': 'Greet the user',
+            'project_id': project_id_str,
+            'prompt_template': 'Hello {{name}}, welcome!',
+            'variables': ['name']
+        },
+        'mock_prompt',
+        id='prompt',
+    ),
+]
+
+
+@pytest.mark.parametrize("path, make_payload, row_fixture", CREATE_CASES)
+def test_create_resource(client, fake_supabase, project_id_str, request, path, make_payload, row_fixture):
+    """Test creating a resource inserts the payload and returns the stored row."""
+    # Setup fake
+    mock_row = request.getfixturevalue(row_fixture)
+    fake_supabase.data = [mock_row]
+    
+    # Make request
+    payload = make_payload(project_id_str)
+    response = client.post(path.format(project_id_str=project_id_str), json=payload)
+    
+    # Assertions
+    assert response.status_code == 201
+    data = response.json()
+    for key, value in payload.items():
+        assert data[key] == value
+    
+    # Verify Supabase insert was called with the payload; model defaults
+    # filled in by the service are ignored
+    (insert_data,), = fake_supabase.calls_to("insert")
+    assert {k: v for k, v in insert_data.items() if k in payload} == payload
+
+
 # ============================================================================
 # Project Tests
 # ============================================================================
@@ -124,18 +345,10 @@ def mock_mcp_config(project_id):
 class TestProjects:
     """Test project CRUD operations."""
     
-    def test_list_projects(self, client, mock_supabase, mock_project):
+    def test_list_projects(self, client, fake_supabase, mock_project):
         """Test listing all projects."""
-        # Setup mock
-        mock_client = Mock()
-        mock_supabase.return_value = mock_client
-        mock_table = Mock()
-        mock_client.table.return_value = mock_table
-        mock_select = Mock()
-        mock_table.select.return_value = mock_select
-        mock_result = Mock()
-        mock_result.data = [mock_project]
-        mock_select.execute.return_value = mock_result
+        # Setup fake
+        fake_supabase.data = [mock_project]
         
         # Make request
         response = client.get('/api/projects')
@@ -147,26 +360,15 @@ class TestProjects:
         assert data[0]['name'] == 'Test Project'
         
         # Verify Supabase was called correctly
-        mock_client.table.assert_called_with('projects')
-        mock_table.select.assert_called_with('*')
+        assert fake_supabase.calls == [("table", "projects"), ("select", "*")]
     
-    def test_get_project(self, client, mock_supabase, mock_project, project_id):
+    def test_get_project(self, client, fake_supabase, mock_project, project_id_str):
         """Test getting a single project."""
-        # Setup mock
-        mock_client = Mock()
-        mock_supabase.return_value = mock_client
-        mock_table = Mock()
-        mock_client.table.return_value = mock_table
-        mock_select = Mock()
-        mock_table.select.return_value = mock_select
-        mock_eq = Mock()
-        mock_select.eq.return_value = mock_eq
-        mock_result = Mock()
-        mock_result.data = [mock_project]
-        mock_eq.execute.return_value = mock_result
+        # Setup fake
+        fake_supabase.data = [mock_project]
         
         # Make request
-        response = client.get(f'/api/projects/{project_id}')
+        response = client.get(f'/api/projects/{project_id_str}')
         
         # Assertions
         assert response.status_code == 200
@@ -174,59 +376,80 @@ class TestProjects:
         assert data['name'] == 'Test Project'
         
         # Verify Supabase was called with correct ID
-        mock_select.eq.assert_called_with('id', str(project_id))
-    
-    def test_create_project(self, client, mock_supabase, mock_project):
-        """Test creating a new project."""
-        # Setup mock
-        mock_client = Mock()
-        mock_supabase.return_value = mock_client
-        mock_table = Mock()
-        mock_client.table.return_value = mock_table
-        mock_insert = Mock()
-        mock_table.insert.return_value = mock_insert
-        mock_result = Mock()
-        mock_result.data = [mock_project]
-        mock_insert.execute.return_value = mock_result
-        
-        # Make request
-        payload = {
-            'name': 'Test Project',
-            'description': 'A test project'
+        assert fake_supabase.calls == [
+            ("table", "projects"), ("select", "*"), ("eq", "id", project_id_str)
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_get_project_with_data(
+        self, fake_supabase, project_id, project_id_str, mock_project, mock_tool, mock_prompt
+    ):
+        """Test that a project comes back with each related table's rows."""
+        fake_supabase.data = {
+            'projects': [mock_project],
+            'tools': [mock_tool],
+            'prompts': [mock_prompt],
         }
-        response = client.post('/api/projects', json=payload)
+        service = SupabaseService('https://test.supabase.co', 'test-key')
         
-        # Assertions
-        assert response.status_code == 201
-        data = response.json()
-        assert data['name'] == 'Test Project'
+        project = await service.get_project_with_data(project_id)
+        service.close()
+        
+        assert project.name == 'Test Project'
+        assert [tool.name for tool in project.tools] == ['test_tool']
+        assert [prompt.name for prompt in project.prompts] == ['greeting']
+        assert project.flows == project.mcp_configs == project.response_configs == []
+        
+        # One query per related table, each filtered to the project
+        assert fake_supabase.calls_to("table") == [
+            ("projects",), ("tools",), ("prompts",), ("flows",), ("mcp_configs",), ("response_configs",)
+        ]
+        assert fake_supabase.calls_to("eq") == [("id", project_id_str)] + [("project_id", project_id_str)] * 5
+    
+    @pytest.mark.asyncio
+    async def test_get_project_with_data_queries_overlap(self, fake_supabase, project_id, mock_project, monkeypatch):
+        """Test that the related tables are queried at the same time."""
+        fake_supabase.data = {'projects': [mock_project]}
+        
+        # Each related-table query waits until all five are in flight; run one
+        # after another, the first would time out
+        barrier = threading.Barrier(5, timeout=5)
+        execute = _FakeQuery.execute
+        
+        def execute_together(query):
+            if query.table_name != 'projects':
+                barrier.wait()
+            return execute(query)
+        
+        monkeypatch.setattr(_FakeQuery, "execute", execute_together)
+        service = SupabaseService('https://test.supabase.co', 'test-key')
         
-        # Verify Supabase insert was called
-        mock_table.insert.assert_called_once()
-        insert_data = mock_table.insert.call_args[0][0]
-        assert insert_data['name'] == 'Test Project'
+        project = await service.get_project_with_data(project_id)
+        service.close()
+        
+        assert project.name == 'Test Project'
+    
+    @pytest.mark.asyncio
+    async def test_get_project_with_data_missing_project(self, fake_supabase, project_id):
+        """Test that no related tables are queried for an unknown project."""
+        fake_supabase.data = []
+        service = SupabaseService('https://test.supabase.co', 'test-key')
+        
+        assert await service.get_project_with_data(project_id) is None
+        service.close()
+        
+        assert fake_supabase.calls_to("table") == [("projects",)]
     
-    def test_update_project(self, client, mock_supabase, mock_project, project_id):
+    def test_update_project(self, client, fake_supabase, project_id_str):
         """Test updating a project."""
-        # Setup mock
-        mock_client = Mock()
-        mock_supabase.return_value = mock_client
-        mock_table = Mock()
-        mock_client.table.return_value = mock_table
-        mock_update = Mock()
-        mock_table.update.return_value = mock_update
-        mock_eq = Mock()
-        mock_update.eq.return_value = mock_eq
-        
-        updated_project = mock_project.copy()
-        updated_project['name'] = 'Updated Project'
-        mock_result = Mock()
-        mock_result.data = [updated_project]
-        mock_eq.execute.return_value = mock_result
+        updated_project = {**_PROJECT_TEMPLATE, 'id': project_id_str, 'name': 'Updated Project'}
+        
+        # Setup fake
+        fake_supabase.data = [updated_project]
         
         # Make request
         payload = {'name': 'Updated Project'}
-        response = client.patch(f'/api/projects/{project_id}', json=payload)
+        response = client.patch(f'/api/projects/{project_id_str}', json=payload)
         
         # Assertions
         assert response.status_code == 200
@@ -234,32 +457,22 @@ class TestProjects:
         assert data['name'] == 'Updated Project'
         
         # Verify Supabase update was called
-        mock_table.update.assert_called_once()
-        mock_update.eq.assert_called_with('id', str(project_id))
+        assert fake_supabase.calls == [
+            ("table", "projects"), ("update", payload), ("eq", "id", project_id_str)
+        ]
     
-    def test_delete_project(self, client, mock_supabase, project_id):
+    def test_delete_project(self, client, fake_supabase, project_id_str):
         """Test deleting a project."""
-        # Setup mock
-        mock_client = Mock()
-        mock_supabase.return_value = mock_client
-        mock_table = Mock()
-        mock_client.table.return_value = mock_table
-        mock_delete = Mock()
-        mock_table.delete.return_value = mock_delete
-        mock_eq = Mock()
-        mock_delete.eq.return_value = mock_eq
-        mock_result = Mock()
-        mock_eq.execute.return_value = mock_result
-        
         # Make request
-        response = client.delete(f'/api/projects/{project_id}')
+        response = client.delete(f'/api/projects/{project_id_str}')
         
         # Assertions
         assert response.status_code == 204
         
         # Verify Supabase delete was called
-        mock_table.delete.assert_called_once()
-        mock_delete.eq.assert_called_with('id', str(project_id))
+        assert fake_supabase.calls == [
+            ("table", "projects"), ("delete",), ("eq", "id", project_id_str)
+        ]
 
 
 # ============================================================================
@@ -269,23 +482,13 @@ class TestProjects:
 class TestTools:
     """Test tool CRUD operations."""
     
-    def test_list_tools(self, client, mock_supabase, mock_tool, project_id):
+    def test_list_tools(self, client, fake_supabase, mock_tool, project_id_str):
         """Test listing tools for a project."""
-        # Setup mock
-        mock_client = Mock()
-        mock_supabase.return_value = mock_client
-        mock_table = Mock()
-        mock_client.table.return_value = mock_table
-        mock_select = Mock()
-        mock_table.select.return_value = mock_select
-        mock_eq = Mock()
-        mock_select.eq.return_value = mock_eq
-        mock_result = Mock()
-        mock_result.data = [mock_tool]
-        mock_eq.execute.return_value = mock_result
+        # Setup fake
+        fake_supabase.data = [mock_tool]
         
         # Make request
-        response = client.get(f'/api/projects/{project_id}/tools')
+        response = client.get(f'/api/projects/{project_id_str}/tools')
         
         # Assertions
         assert response.status_code == 200
@@ -294,53 +497,9 @@ class TestTools:
         assert data[0]['name'] == 'test_tool'
         
         # Verify Supabase was called correctly
-        mock_client.table.assert_called_with('tools')
-        mock_select.eq.assert_called_with('project_id', str(project_id))
-    
-    def test_create_tool(self, client, mock_supabase, mock_tool, project_id):
-        """Test creating a new tool."""
-        # Setup mock
-        mock_client = Mock()
-        mock_supabase.return_value = mock_client
-        mock_table = Mock()
-        mock_client.table.return_value = mock_table
-        mock_insert = Mock()
-        mock_table.insert.return_value = mock_insert
-        mock_result = Mock()
-        mock_result.data = [mock_tool]
-        mock_insert.execute.return_value = mock_result
-        
-        # Make request
-        payload = {
-            'name': 'test_tool',
-            'description': 'A test tool',
-            'project_id': str(project_id),
-            'tool_config': {
-                'api': {
-                    'base_url': 'https://api.example.com',
-                    'method': 'GET',
-                    'headers': {},
-                    'params': {},
-                    'auth': {'method': 'none'},
-                    'timeout': 30.0
-                },
-                'input_schema': {'type': 'object', 'properties': {}},
-                'output_schema': {'type': 'object'}
-            }
-        }
-        response = client.post(f'/api/projects/{project_id}/tools', json=payload)
-        
-        # Assertions
-        assert response.status_code == 201
-        data = response.json()
-        assert data['name'] == 'test_tool'
-        assert 'tool_config' in data
-        
-        # Verify Supabase insert was called
-        mock_table.insert.assert_called_once()
-        insert_data = mock_table.insert.call_args[0][0]
-        assert insert_data['name'] == 'test_tool'
-        assert insert_data['project_id'] == str(project_id)
+        assert fake_supabase.calls == [
+            ("table", "tools"), ("select", "*"), ("eq", "project_id", project_id_str)
+        ]
 
 
 # ============================================================================
@@ -350,31 +509,23 @@ class TestTools:
 class TestMCPConfigs:
     """Test MCP config CRUD operations."""
     
-    def test_create_mcp_config(self, client, mock_supabase, mock_mcp_config, project_id, tool_id):
+    def test_create_mcp_config(self, client, fake_supabase, mock_mcp_config, project_id_str, tool_id_str):
         """Test creating a new MCP config with selected tools."""
-        # Setup mock
-        mock_client = Mock()
-        mock_supabase.return_value = mock_client
-        mock_table = Mock()
-        mock_client.table.return_value = mock_table
-        mock_insert = Mock()
-        mock_table.insert.return_value = mock_insert
-        mock_result = Mock()
-        mock_result.data = [mock_mcp_config]
-        mock_insert.execute.return_value = mock_result
+        # Setup fake
+        fake_supabase.data = [mock_mcp_config]
         
         # Make request
         payload = {
             'name': 'Test MCP Config',
-            'project_id': str(project_id),
+            'project_id': project_id_str,
             'model': 'gpt-4o-mini',
             'temperature': 0.7,
             'max_tokens': 1000,
             'system_prompt': 'You are a helpful assistant',
             'instruction': 'Answer questions clearly',
-            'selected_tool_ids': [str(tool_id)]
+            'selected_tool_ids': [tool_id_str]
         }
-        response = client.post(f'/api/projects/{project_id}/mcp-configs', json=payload)
+        response = client.post(f'/api/projects/{project_id_str}/mcp-configs', json=payload)
         
         # Assertions
         assert response.status_code == 201
@@ -382,33 +533,39 @@ class TestMCPConfigs:
         assert data['name'] == 'Test MCP Config'
         assert data['model'] == 'gpt-4o-mini'
         
-        # Verify Supabase insert was called with UUID array conversion
-        mock_table.insert.assert_called_once()
-        insert_data = mock_table.insert.call_args[0][0]
-        assert insert_data['name'] == 'Test MCP Config'
-        assert insert_data['project_id'] == str(project_id)
-        assert str(tool_id) in insert_data['selected_tool_ids']
+        # Verify Supabase insert was called with UUIDs converted back to strings
+        (insert_data,), = fake_supabase.calls_to("insert")
+        assert {k: v for k, v in insert_data.items() if k in payload} == payload
+    
+    def test_create_mcp_config_rejects_invalid_tool_id(self, client, fake_supabase, project_id_str):
+        """Test that a malformed tool ID is rejected before reaching Supabase."""
+        fake_supabase.data = []
+        
+        payload = {
+            'name': 'Test MCP Config',
+            'project_id': project_id_str,
+            'selected_tool_ids': ['not-a-uuid']
+        }
+        response = client.post(f'/api/projects/{project_id_str}/mcp-configs', json=payload)
+        
+        assert response.status_code == 422
+        assert 'not-a-uuid' in response.text
+        assert fake_supabase.calls_to("insert") == []
     
-    def test_update_mcp_config_deployment(self, client, mock_supabase, mock_mcp_config):
+    def test_update_mcp_config_deployment(self, client, fake_supabase, project_id_str):
         """Test updating MCP config deployment status."""
         config_id = uuid4()
         
-        # Setup mock
-        mock_client = Mock()
-        mock_supabase.return_value = mock_client
-        mock_table = Mock()
-        mock_client.table.return_value = mock_table
-        mock_update = Mock()
-        mock_table.update.return_value = mock_update
-        mock_eq = Mock()
-        mock_update.eq.return_value = mock_eq
-        
-        updated_config = mock_mcp_config.copy()
-        updated_config['deployment_status'] = 'deployed'
-        updated_config['deployment_url'] = 'https://deployed.example.com'
-        mock_result = Mock()
-        mock_result.data = [updated_config]
-        mock_eq.execute.return_value = mock_result
+        updated_config = {
+            **_MCP_CONFIG_TEMPLATE,
+            'id': str(config_id),
+            'project_id': project_id_str,
+            'deployment_status': 'deployed',
+            'deployment_url': 'https://deployed.example.com'
+        }
+        
+        # Setup fake
+        fake_supabase.data = [updated_config]
         
         # Make request
         payload = {
@@ -424,115 +581,9 @@ class TestMCPConfigs:
         assert data['deployment_url'] == 'https://deployed.example.com'
         
         # Verify Supabase update was called
-        mock_table.update.assert_called_once()
-
-
-# ============================================================================
-# Response Config Tests
-# ============================================================================
-
-class TestResponseConfigs:
-    """Test response config CRUD operations."""
-    
-    def test_create_response_config(self, client, mock_supabase, project_id):
-        """Test creating a response config."""
-        config_id = uuid4()
-        mock_response_config = {
-            'id': str(config_id),
-            'numeric_id': 1,  # Frontend-compatible numeric ID
-            'project_id': str(project_id),
-            'name': 'Test Response Config',
-            'type': 'llm-reprocess',
-            'reprocess_instructions': 'Format as markdown',
-            'error_handling': 'retry',
-            'created_at': datetime.now().isoformat(),
-            'updated_at': datetime.now().isoformat()
-        }
-        
-        # Setup mock
-        mock_client = Mock()
-        mock_supabase.return_value = mock_client
-        mock_table = Mock()
-        mock_client.table.return_value = mock_table
-        mock_insert = Mock()
-        mock_table.insert.return_value = mock_insert
-        mock_result = Mock()
-        mock_result.data = [mock_response_config]
-        mock_insert.execute.return_value = mock_result
-        
-        # Make request
-        payload = {
-            'name': 'Test Response Config',
-            'project_id': str(project_id),
-            'type': 'llm-reprocess',
-            'reprocess_instructions': 'Format as markdown',
-            'error_handling': 'retry'
-        }
-        response = client.post(f'/api/projects/{project_id}/response-configs', json=payload)
-        
-        # Assertions
-        assert response.status_code == 201
-        data = response.json()
-        assert data['name'] == 'Test Response Config'
-        assert data['type'] == 'llm-reprocess'
-        assert data['error_handling'] == 'retry'
-        
-        # Verify Supabase insert was called
-        mock_table.insert.assert_called_once()
-
-
-# ============================================================================
-# Prompt Tests
-# ============================================================================
-
-class TestPrompts:
-    """Test prompt CRUD operations."""
-    
-    def test_create_prompt(self, client, mock_supabase, project_id):
-        """Test creating a prompt."""
-        prompt_id = uuid4()
-        mock_prompt = {
-            'id': str(prompt_id),
-            'numeric_id': 1,  # Frontend-compatible numeric ID
-            'project_id': str(project_id),
-            'name': 'greeting',
-            'description': 'Greet the user',
-            'prompt_template': 'Hello {{name}}, welcome!',
-            'content': 'Hello {{name}}, welcome!',  # Frontend-compatible content field
-            'variables': ['name'],
-            'created_at': datetime.now().isoformat(),
-            'updated_at': datetime.now().isoformat()
-        }
-        
-        # Setup mock
-        mock_client = Mock()
-        mock_supabase.return_value = mock_client
-        mock_table = Mock()
-        mock_client.table.return_value = mock_table
-        mock_insert = Mock()
-        mock_table.insert.return_value = mock_insert
-        mock_result = Mock()
-        mock_result.data = [mock_prompt]
-        mock_insert.execute.return_value = mock_result
-        
-        # Make request
-        payload = {
-            'name': 'greeting',
-            'description': 'Greet the user',
-            'project_id': str(project_id),
-            'prompt_template': 'Hello {{name}}, welcome!',
-            'variables': ['name']
-        }
-        response = client.post(f'/api/projects/{project_id}/prompts', json=payload)
-        
-        # Assertions
-        assert response.status_code == 201
-        data = response.json()
-        assert data['name'] == 'greeting'
-        assert 'name' in data['variables']
-        
-        # Verify Supabase insert was called
-        mock_table.insert.assert_called_once()
+        assert fake_supabase.calls == [
+            ("table", "mcp_configs"), ("update", payload), ("eq", "id", str(config_id))
+        ]
 
 
 # ============================================================================
@@ -542,15 +593,12 @@ class TestPrompts:
 class TestFlows:
     """Test flow CRUD operations."""
     
-    def test_create_flow(self, client, mock_supabase, project_id):
+    def test_create_flow(self, client, fake_supabase, project_id_str):
         """Test creating a flow with steps."""
-        flow_id = uuid4()
-        mock_flow = {
-            'id': str(flow_id),
-            'numeric_id': 1,  # Frontend-compatible numeric ID
-            'project_id': str(project_id),
+        payload = {
             'name': 'test_workflow',
             'description': 'Test workflow',
+            'project_id': project_id_str,
             'steps': {
                 'nodes': [
                     {'id': 'node1', 'type': 'query', 'position': {'x': 0, 'y': 0}},
@@ -559,53 +607,34 @@ class TestFlows:
                 'edges': [
                     {'id': 'edge1', 'source': 'node1', 'target': 'node2'}
                 ]
-            },
-            'steps_array': None,  # Optional linear array format for v6 builder
-            'created_at': datetime.now().isoformat(),
-            'updated_at': datetime.now().isoformat()
+            }
         }
         
-        # Setup mock
-        mock_client = Mock()
-        mock_supabase.return_value = mock_client
-        mock_table = Mock()
-        mock_client.table.return_value = mock_table
-        mock_insert = Mock()
-        mock_table.insert.return_value = mock_insert
-        mock_result = Mock()
-        mock_result.data = [mock_flow]
-        mock_insert.execute.return_value = mock_result
+        # Setup fake: the stored row is the payload plus generated fields
+        fake_supabase.data = [{
+            **payload,
+            'id': str(_FLOW_ID),
+            'numeric_id': 1,  # Frontend-compatible numeric ID
+            'steps_array': None,  # Optional linear array format for v6 builder
+            'created_at': _NOW_ISO,
+            'updated_at': _NOW_ISO
+        }]
         
         # Make request
-        payload = {
-            'name': 'test_workflow',
-            'description': 'Test workflow',
-            'project_id': str(project_id),
-            'steps': {
-                'nodes': [
-                    {'id': 'node1', 'type': 'query', 'position': {'x': 0, 'y': 0}},
-                    {'id': 'node2', 'type': 'llm', 'position': {'x': 100, 'y': 100}}
-                ],
-                'edges': [
-                    {'id': 'edge1', 'source': 'node1', 'target': 'node2'}
-                ]
-            }
-        }
-        response = client.post(f'/api/projects/{project_id}/flows', json=payload)
+        response = client.post(f'/api/projects/{project_id_str}/flows', json=payload)
         
         # Assertions
         assert response.status_code == 201
         data = response.json()
+        assert data['id'] == str(_FLOW_ID)
         assert data['name'] == 'test_workflow'
         assert 'nodes' in data['steps']
         assert 'edges' in data['steps']
         assert len(data['steps']['nodes']) == 2
         
-        # Verify Supabase insert was called
-        mock_table.insert.assert_called_once()
-        insert_data = mock_table.insert.call_args[0][0]
-        assert insert_data['name'] == 'test_workflow'
-        assert 'steps' in insert_data
+        # Verify Supabase insert was called with the payload
+        (insert_data,), = fake_supabase.calls_to("insert")
+        assert {k: v for k, v in insert_data.items() if k in payload} == payload
 
 
 # ============================================================================
@@ -615,42 +644,60 @@ class TestFlows:
 class TestIntegration:
     """Test complete workflows with multiple entities."""
     
-    def test_create_project_with_full_setup(self, client, mock_supabase, project_id, tool_id):
-        """Test creating a complete project setup."""
-        # This would be a more complex test that creates:
-        # 1. A project
-        # 2. Tools for that project
-        # 3. MCP configs referencing those tools
-        # 4. Response configs
-        # 5. Flows
-        # 
-        # Then verifies all the Supabase calls were made correctly
-        pass  # Placeholder for complex integration test
-    
-    def test_project_cascade_delete(self, client, mock_supabase, project_id):
-        """Test that deleting a project cascades to all children."""
-        # Setup mock
-        mock_client = Mock()
-        mock_supabase.return_value = mock_client
-        mock_table = Mock()
-        mock_client.table.return_value = mock_table
-        mock_delete = Mock()
-        mock_table.delete.return_value = mock_delete
-        mock_eq = Mock()
-        mock_delete.eq.return_value = mock_eq
-        mock_result = Mock()
-        mock_eq.execute.return_value = mock_result
+    def test_create_project_with_full_setup(self, client, fake_supabase, project_id_str, request):
+        """Test creating a project and its entities, then reading it back whole."""
+        # Every table returns the row its create stores
+        fake_supabase.data = {
+            'projects': [request.getfixturevalue('mock_project')],
+            'tools': [request.getfixturevalue('mock_tool')],
+            'response_configs': [request.getfixturevalue('mock_response_config')],
+            'prompts': [request.getfixturevalue('mock_prompt')],
+        }
+        
+        # Create the project and each entity through the API
+        for case in CREATE_CASES:
+            path, make_payload, _ = case.values
+            response = client.post(path.format(project_id_str=project_id_str), json=make_payload(project_id_str))
+            assert response.status_code == 201
+        
+        response = client.get(f'/api/projects/{project_id_str}/full')
         
+        # Assertions
+        assert response.status_code == 200
+        data = response.json()
+        assert data['name'] == 'Test Project'
+        assert [tool['name'] for tool in data['tools']] == ['test_tool']
+        assert [config['name'] for config in data['response_configs']] == ['Test Response Config']
+        assert [prompt['name'] for prompt in data['prompts']] == ['greeting']
+        assert data['mcp_configs'] == data['flows'] == []
+        
+        # Verify each create inserted into its own table
+        calls = fake_supabase.calls
+        inserted_tables = [calls[i - 1][1] for i, call in enumerate(calls) if call[0] == "insert"]
+        assert inserted_tables == ['projects', 'tools', 'response_configs', 'prompts']
+    
+    def test_project_cascade_delete(self, client, fake_supabase, project_id_str):
+        """Test that deleting a project cascades to all children."""
         # Delete project
-        response = client.delete(f'/api/projects/{project_id}')
+        response = client.delete(f'/api/projects/{project_id_str}')
         
         # Assertions
         assert response.status_code == 204
         
         # Verify Supabase delete was called
         # (Cascade is handled by database foreign keys)
-        mock_table.delete.assert_called_once()
-        mock_delete.eq.assert_called_with('id', str(project_id))
+        assert fake_supabase.calls == [
+            ("table", "projects"), ("delete",), ("eq", "id", project_id_str)
+        ]
+    
+    def test_cached_services_closed_at_shutdown(self, fake_supabase):
+        """Test that shutdown closes the cached service's HTTP client."""
+        service = _get_supabase_service('https://test.supabase.co', 'test-key', 1, 2)
+        
+        close_cached_services()
+        
+        assert service._http_client.is_closed
+        assert _get_supabase_service.cache_info().currsize == 0
 
 
 # ============================================================================
@@ -1,342 +1,329 @@
 """Tests for HTTPClientService."""
 
+from typing import Callable, Dict, Optional, Tuple
+
 import pytest
-from unittest.mock import AsyncMock, patch
+import pytest_asyncio
 import httpx
-from pytest_httpx import HTTPXMock
+from tenacity import wait_none
 
 from dynamic_tools.models.http_spec import HTTPRequestSpec, HTTPResponseSpec
+from dynamic_tools.services import http_client as http_client_module
+from dynamic_tools.services.http_client import HTTPClientService
 
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-@pytest.mark.asyncio
-async def test_http_client_get_request(httpx_mock: HTTPXMock):
-    """Test executing a GET request.
-    
-    Given: A GET HTTPRequestSpec
-    When: Executing the request
-    Then: Should return HTTPResponseSpec with response data
-    """
-    from dynamic_tools.services.http_client import HTTPClientService
-    
-    # Mock the HTTP response
-    httpx_mock.add_response(
-        method="GET",
-        url="https://api.example.com/users",
-        json={"users": [{"id": 1, "name": "John"}]},
-        status_code=200
-    )
-    
-    client = HTTPClientService()
-    
-    spec = HTTPRequestSpec(
-        method="GET",
-        url="https://api.example.com/users"
-    )
-    
-    response = await client.execute(spec)
-    
-    assert response.status_code == 200
-    assert response.body == {"users": [{"id": 1, "name": "John"}]}
-    assert response.execution_time_ms is not None
-    assert response.execution_time_ms > 0
+Handler = Callable[[httpx.Request], httpx.Response]
 
 
-@pytest.mark.asyncio
-async def test_http_client_post_request_with_json(httpx_mock: HTTPXMock):
-    """Test executing a POST request with JSON body.
-    
-    Given: A POST HTTPRequestSpec with JSON body
-    When: Executing the request
-    Then: Should send JSON and return response
-    """
-    from dynamic_tools.services.http_client import HTTPClientService
-    
-    # Mock the HTTP response
-    httpx_mock.add_response(
-        method="POST",
-        url="https://api.example.com/users",
-        json={"id": 123, "name": "John Doe"},
-        status_code=201
-    )
-    
-    client = HTTPClientService()
-    
-    spec = HTTPRequestSpec(
-        method="POST",
-        url="https://api.example.com/users",
-        headers={"Content-Type": "application/json"},
-        body={"name": "John Doe", "email": "john@example.com"}
-    )
+_API_BASE = "https://api.example.com"
+
+
+def _spec(method: str, path: str, **kwargs) -> HTTPRequestSpec:
+    """HTTPRequestSpec for a path on the example API."""
+    return HTTPRequestSpec(method=method, url=_API_BASE + path, **kwargs)
+
+
+def _respond(
+    status_code: int,
+    json: Optional[object] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> Handler:
+    """Route handler that answers every request with the same response."""
+    return lambda request: httpx.Response(status_code, json=json, headers=headers)
+
+
+@pytest.fixture(scope="module")
+def routes() -> Dict[Tuple[str, str], Handler]:
+    """Route table of the module's mock transport, keyed by (method, URL).
     
-    response = await client.execute(spec)
+    The URL key leaves out the query string; handlers that care about query
+    parameters check request.url.params themselves.
     
-    assert response.status_code == 201
-    assert response.body == {"id": 123, "name": "John Doe"}
+    Tests register the handlers they need; the table is emptied after each
+    test so routes never leak between them. Like the transport and client
+    built on it, the table is local to each pytest-xdist worker.
+    """
+    return {}
 
 
-@pytest.mark.asyncio
-async def test_http_client_with_headers(httpx_mock: HTTPXMock):
-    """Test executing request with custom headers.
+@pytest.fixture(autouse=True)
+def _clear_routes(routes):
+    """Drop the routes registered by the previous test."""
+    yield
+    routes.clear()
+
+
+@pytest.fixture(scope="module")
+def mock_transport(routes):
+    """One httpx.MockTransport for the module, dispatching through routes.
     
-    Given: HTTPRequestSpec with custom headers
-    When: Executing the request
-    Then: Should include headers in request
+    A request without a registered route fails the test that sent it.
     """
-    from dynamic_tools.services.http_client import HTTPClientService
-    
-    httpx_mock.add_response(
-        method="GET",
-        url="https://api.example.com/protected",
-        json={"data": "secret"},
-        status_code=200
-    )
-    
-    client = HTTPClientService()
+    def dispatch(request: httpx.Request) -> httpx.Response:
+        try:
+            handler = routes[(request.method, str(request.url.copy_with(query=None)))]
+        except KeyError:
+            raise AssertionError(f"No route for {request.method} {request.url}") from None
+        return handler(request)
     
-    spec = HTTPRequestSpec(
-        method="GET",
-        url="https://api.example.com/protected",
-        headers={"Authorization": "Bearer token123"}
-    )
-    
-    response = await client.execute(spec)
-    
-    assert response.status_code == 200
-    # Verify headers were sent (pytest-httpx will fail if headers don't match)
+    return httpx.MockTransport(dispatch)
 
 
-@pytest.mark.asyncio
-async def test_http_client_with_query_params(httpx_mock: HTTPXMock):
-    """Test executing request with query parameters.
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def client(mock_transport):
+    """HTTPClientService with default settings, shared by the module's tests.
     
-    Given: HTTPRequestSpec with query parameters
+    It sends requests through the module's mock transport. Tests that need a
+    different timeout or retry budget build their own around the transport.
+    """
+    async with httpx.AsyncClient(transport=mock_transport) as http_client:
+        yield HTTPClientService(client=http_client)
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_encoder(request, monkeypatch):
+    """Run a test once with orjson encoding request bodies and once without."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(http_client_module, "orjson", None)
+    return request.param
+
+
+METHOD_CASES = [
+    pytest.param(
+        _spec("GET", "/users"),
+        200, {"users": [{"id": 1, "name": "John"}]}, None,
+        id="get",
+    ),
+    pytest.param(
+        _spec(
+            "POST", "/users",
+            headers={"Content-Type": "application/json"},
+            body={"name": "John Doe", "email": "john@example.com"}
+        ),
+        201, {"id": 123, "name": "John Doe"}, None,
+        id="post-json",
+    ),
+    pytest.param(
+        _spec("PUT", "/users/123", body={"name": "Updated"}),
+        200, {"id": 123, "name": "Updated"}, None,
+        id="put",
+    ),
+    pytest.param(
+        _spec("DELETE", "/users/123"),
+        204, None, None,
+        id="delete",
+    ),
+    pytest.param(
+        _spec("PATCH", "/users/123", body={"email": "new@example.com"}),
+        200, {"id": 123, "email": "new@example.com"}, None,
+        id="patch",
+    ),
+    pytest.param(
+        _spec("HEAD", "/resource"),
+        200, None, {"Content-Length": "1234"},
+        id="head",
+    ),
+    pytest.param(
+        _spec("OPTIONS", "/resource"),
+        200, None, {"Allow": "GET, POST, PUT, DELETE"},
+        id="options",
+    ),
+]
+
+
+@pytest.mark.parametrize("spec, status_code, response_json, response_headers", METHOD_CASES)
+async def test_http_client_method(
+    client, routes, spec, status_code, response_json, response_headers
+):
+    """Test executing a request for each HTTP method.
+    
+    Given: An HTTPRequestSpec for one method, with a JSON body where it sends one
     When: Executing the request
-    Then: Should include query params in URL
+    Then: Should return HTTPResponseSpec with the mocked status and body
     """
-    from dynamic_tools.services.http_client import HTTPClientService
-    
-    httpx_mock.add_response(
-        method="GET",
-        url="https://api.example.com/search?q=test&limit=10",
-        json={"results": []},
-        status_code=200
-    )
-    
-    client = HTTPClientService()
-    
-    spec = HTTPRequestSpec(
-        method="GET",
-        url="https://api.example.com/search",
-        query_params={"q": "test", "limit": "10"}
-    )
+    routes[(spec.method, spec.url)] = _respond(status_code, json=response_json, headers=response_headers)
     
     response = await client.execute(spec)
     
-    assert response.status_code == 200
+    assert response.status_code == status_code
+    if response_json is not None:
+        assert response.body == response_json
 
 
-@pytest.mark.asyncio
-async def test_http_client_put_request(httpx_mock: HTTPXMock):
-    """Test executing a PUT request.
+async def test_http_client_with_headers(client, routes):
+    """Test executing request with custom headers.
     
-    Given: A PUT HTTPRequestSpec
+    Given: HTTPRequestSpec with custom headers
     When: Executing the request
-    Then: Should perform PUT and return response
+    Then: Should include headers in request
     """
-    from dynamic_tools.services.http_client import HTTPClientService
+    sent = []
     
-    httpx_mock.add_response(
-        method="PUT",
-        url="https://api.example.com/users/123",
-        json={"id": 123, "name": "Updated"},
-        status_code=200
-    )
+    def respond(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(200, json={"data": "secret"})
     
-    client = HTTPClientService()
+    routes[("GET", _API_BASE + "/protected")] = respond
     
-    spec = HTTPRequestSpec(
-        method="PUT",
-        url="https://api.example.com/users/123",
-        body={"name": "Updated"}
-    )
+    spec = _spec("GET", "/protected", headers={"Authorization": "Bearer token123"})
     
     response = await client.execute(spec)
     
     assert response.status_code == 200
+    (request,) = sent
+    assert request.headers["Authorization"] == "Bearer token123"
 
 
-@pytest.mark.asyncio
-async def test_http_client_delete_request(httpx_mock: HTTPXMock):
-    """Test executing a DELETE request.
+async def test_http_client_json_body_encoding(client, routes, json_encoder):
+    """Test the bytes and content type sent for a dict body.
     
-    Given: A DELETE HTTPRequestSpec
-    When: Executing the request
-    Then: Should perform DELETE and return response
+    Given: A POST spec with a dict body holding non-ASCII text and an integer
+           wider than 64 bits
+    When: Executing the request with either JSON encoder
+    Then: Should send the same compact UTF-8 JSON, labelled application/json
     """
-    from dynamic_tools.services.http_client import HTTPClientService
+    sent = []
     
-    httpx_mock.add_response(
-        method="DELETE",
-        url="https://api.example.com/users/123",
-        status_code=204
-    )
+    def respond(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(201, json={"id": 1})
     
-    client = HTTPClientService()
+    routes[("POST", _API_BASE + "/users")] = respond
     
-    spec = HTTPRequestSpec(
-        method="DELETE",
-        url="https://api.example.com/users/123"
-    )
+    spec = _spec("POST", "/users", body={"name": "Zoë", "tags": ["a", "b"], "big": 2**70})
     
     response = await client.execute(spec)
     
-    assert response.status_code == 204
+    assert response.status_code == 201
+    (request,) = sent
+    assert request.content == '{"name":"Zoë","tags":["a","b"],"big":1180591620717411303424}'.encode()
+    assert request.headers["content-type"] == "application/json"
 
 
-@pytest.mark.asyncio
-async def test_http_client_patch_request(httpx_mock: HTTPXMock):
-    """Test executing a PATCH request.
+async def test_http_client_with_query_params(client, routes):
+    """Test executing request with query parameters.
     
-    Given: A PATCH HTTPRequestSpec
+    Given: HTTPRequestSpec with query parameters
     When: Executing the request
-    Then: Should perform PATCH and return response
+    Then: Should include query params in URL
     """
-    from dynamic_tools.services.http_client import HTTPClientService
+    sent = []
     
-    httpx_mock.add_response(
-        method="PATCH",
-        url="https://api.example.com/users/123",
-        json={"id": 123, "email": "new@example.com"},
-        status_code=200
-    )
+    def respond(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(200, json={"results": []})
     
-    client = HTTPClientService()
+    routes[("GET", _API_BASE + "/search")] = respond
     
-    spec = HTTPRequestSpec(
-        method="PATCH",
-        url="https://api.example.com/users/123",
-        body={"email": "new@example.com"}
-    )
+    spec = _spec("GET", "/search", query_params={"q": "test", "limit": "10"})
     
     response = await client.execute(spec)
     
     assert response.status_code == 200
+    (request,) = sent
+    assert request.url.params["q"] == "test"
+    assert request.url.params["limit"] == "10"
 
 
-@pytest.mark.asyncio
-async def test_http_client_timeout():
+async def test_http_client_timeout(mock_transport, routes, monkeypatch):
     """Test timeout handling.
     
     Given: HTTPClientService with timeout
     When: Request takes too long
     Then: Should raise timeout exception
     """
-    from dynamic_tools.services.http_client import HTTPClientService
+    # Simulate the timeout instead of waiting on a slow real server, and
+    # skip the backoff between the retries it triggers. Only a request that
+    # carries the service's timeout times out, so the service must send it.
+    def time_out(request: httpx.Request) -> httpx.Response:
+        if request.extensions["timeout"]["read"] == 0.001:
+            raise httpx.ReadTimeout("Read timed out", request=request)
+        return httpx.Response(200, json={"data": "too slow to matter"})
     
-    client = HTTPClientService(timeout=0.001)  # Very short timeout
+    routes[("GET", _API_BASE + "/slow")] = time_out
+    monkeypatch.setattr(HTTPClientService._execute_with_retry.retry, "wait", wait_none())
     
-    spec = HTTPRequestSpec(
-        method="GET",
-        url="https://httpbin.org/delay/10"  # Long delay
-    )
+    spec = _spec("GET", "/slow")
     
-    with pytest.raises(Exception) as exc_info:
-        await client.execute(spec)
+    async with httpx.AsyncClient(transport=mock_transport) as http_client:
+        client = HTTPClientService(timeout=0.001, client=http_client)  # Very short timeout
+        with pytest.raises(Exception) as exc_info:
+            await client.execute(spec)
     
     # Should be a timeout error
     assert "timeout" in str(exc_info.value).lower() or "timed out" in str(exc_info.value).lower()
 
 
-@pytest.mark.asyncio
-async def test_http_client_retry_on_failure(httpx_mock: HTTPXMock):
+async def test_http_client_retry_on_failure(client, routes):
     """Test retry logic on transient failures.
     
     Given: HTTP request fails on first attempt
     When: Executing with retry logic
     Then: Should retry and eventually succeed
     """
-    from dynamic_tools.services.http_client import HTTPClientService
-    
     # First call fails with 500, second succeeds
-    httpx_mock.add_response(
-        method="GET",
-        url="https://api.example.com/unstable",
-        status_code=500
-    )
-    httpx_mock.add_response(
-        method="GET",
-        url="https://api.example.com/unstable",
-        json={"data": "success"},
-        status_code=200
-    )
+    calls = 0
     
-    client = HTTPClientService(max_retries=3)
+    def respond(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            return httpx.Response(500)
+        return httpx.Response(200, json={"data": "success"})
     
-    spec = HTTPRequestSpec(
-        method="GET",
-        url="https://api.example.com/unstable"
-    )
+    routes[("GET", _API_BASE + "/unstable")] = respond
+    
+    spec = _spec("GET", "/unstable")
     
     response = await client.execute(spec)
     
     # Should have succeeded after retry
     assert response.status_code == 200
     assert response.body == {"data": "success"}
+    assert calls == 2
 
 
-@pytest.mark.asyncio
-async def test_http_client_max_retries_exceeded(httpx_mock: HTTPXMock):
+async def test_http_client_max_retries_exceeded(mock_transport, routes):
     """Test that client fails after max retries.
     
     Given: HTTP request consistently fails
     When: Executing with retry logic
     Then: Should fail after max attempts
     """
-    from dynamic_tools.services.http_client import HTTPClientService
-    
-    # Always return 500 (3 attempts total with max_retries=2)
-    for _ in range(3):
-        httpx_mock.add_response(
-            method="GET",
-            url="https://api.example.com/broken",
-            status_code=500,
-            json={"error": "Server error"}
-        )
-    
-    client = HTTPClientService(max_retries=2)
-    
-    spec = HTTPRequestSpec(
-        method="GET",
-        url="https://api.example.com/broken"
-    )
+    # Always return 500, counting the attempts
+    calls = 0
     
-    with pytest.raises(Exception):
-        await client.execute(spec)
+    def respond(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(500, json={"error": "Server error"})
+    
+    routes[("GET", _API_BASE + "/broken")] = respond
+    
+    spec = _spec("GET", "/broken")
+    
+    async with httpx.AsyncClient(transport=mock_transport) as http_client:
+        client = HTTPClientService(max_retries=2, client=http_client)
+        with pytest.raises(Exception):
+            await client.execute(spec)
+    
+    # The retry policy allows three attempts in total
+    assert calls == 3
 
 
-@pytest.mark.asyncio
-async def test_http_client_4xx_error(httpx_mock: HTTPXMock):
+async def test_http_client_4xx_error(client, routes):
     """Test handling 4xx client errors.
     
     Given: API returns 404 Not Found
     When: Executing the request
     Then: Should return response with 404 status
     """
-    from dynamic_tools.services.http_client import HTTPClientService
+    routes[("GET", _API_BASE + "/notfound")] = _respond(404, json={"error": "Not found"})
     
-    httpx_mock.add_response(
-        method="GET",
-        url="https://api.example.com/notfound",
-        status_code=404,
-        json={"error": "Not found"}
-    )
-    
-    client = HTTPClientService()
-    
-    spec = HTTPRequestSpec(
-        method="GET",
-        url="https://api.example.com/notfound"
-    )
+    spec = _spec("GET", "/notfound")
     
     response = await client.execute(spec)
     
@@ -344,30 +331,20 @@ async def test_http_client_4xx_error(httpx_mock: HTTPXMock):
     assert response.body == {"error": "Not found"}
 
 
-@pytest.mark.asyncio
-async def test_http_client_response_headers(httpx_mock: HTTPXMock):
+async def test_http_client_response_headers(client, routes):
     """Test that response headers are captured.
     
     Given: API returns response with headers
     When: Executing the request
     Then: Should capture response headers
     """
-    from dynamic_tools.services.http_client import HTTPClientService
-    
-    httpx_mock.add_response(
-        method="GET",
-        url="https://api.example.com/data",
+    routes[("GET", _API_BASE + "/data")] = _respond(
+        200,
         json={"data": "value"},
-        status_code=200,
         headers={"Content-Type": "application/json", "X-Custom": "header"}
     )
     
-    client = HTTPClientService()
-    
-    spec = HTTPRequestSpec(
-        method="GET",
-        url="https://api.example.com/data"
-    )
+    spec = _spec("GET", "/data")
     
     response = await client.execute(spec)
     
@@ -376,28 +353,16 @@ async def test_http_client_response_headers(httpx_mock: HTTPXMock):
     assert "content-type" in response.headers or "Content-Type" in response.headers
 
 
-@pytest.mark.asyncio
-async def test_http_client_empty_response_body(httpx_mock: HTTPXMock):
+async def test_http_client_empty_response_body(client, routes):
     """Test handling response with no body.
     
     Given: API returns 204 No Content
     When: Executing the request
     Then: Should handle empty body gracefully
     """
-    from dynamic_tools.services.http_client import HTTPClientService
+    routes[("DELETE", _API_BASE + "/resource")] = _respond(204)
     
-    httpx_mock.add_response(
-        method="DELETE",
-        url="https://api.example.com/resource",
-        status_code=204
-    )
-    
-    client = HTTPClientService()
-    
-    spec = HTTPRequestSpec(
-        method="DELETE",
-        url="https://api.example.com/resource"
-    )
+    spec = _spec("DELETE", "/resource")
     
     response = await client.execute(spec)
     
@@ -405,30 +370,20 @@ async def test_http_client_empty_response_body(httpx_mock: HTTPXMock):
     assert response.body is None or response.body == "" or response.body == {}
 
 
-@pytest.mark.asyncio
-async def test_http_client_non_json_response(httpx_mock: HTTPXMock):
+async def test_http_client_non_json_response(client, routes):
     """Test handling non-JSON response.
     
     Given: API returns plain text
     When: Executing the request
     Then: Should handle text response
     """
-    from dynamic_tools.services.http_client import HTTPClientService
-    
-    httpx_mock.add_response(
-        method="GET",
-        url="https://api.example.com/text",
+    routes[("GET", _API_BASE + "/text")] = lambda request: httpx.Response(
+        200,
         text="Plain text response",
-        status_code=200,
         headers={"Content-Type": "text/plain"}
     )
     
-    client = HTTPClientService()
-    
-    spec = HTTPRequestSpec(
-        method="GET",
-        url="https://api.example.com/text"
-    )
+    spec = _spec("GET", "/text")
     
     response = await client.execute(spec)
     
@@ -436,29 +391,16 @@ async def test_http_client_non_json_response(httpx_mock: HTTPXMock):
     assert response.body == "Plain text response" or isinstance(response.body, str)
 
 
-@pytest.mark.asyncio
-async def test_http_client_execution_time_tracking(httpx_mock: HTTPXMock):
+async def test_http_client_execution_time_tracking(client, routes):
     """Test that execution time is tracked.
     
     Given: A successful HTTP request
     When: Executing the request
     Then: Should track execution time in milliseconds
     """
-    from dynamic_tools.services.http_client import HTTPClientService
-    
-    httpx_mock.add_response(
-        method="GET",
-        url="https://api.example.com/data",
-        json={"data": "value"},
-        status_code=200
-    )
+    routes[("GET", _API_BASE + "/data")] = _respond(200, json={"data": "value"})
     
-    client = HTTPClientService()
-    
-    spec = HTTPRequestSpec(
-        method="GET",
-        url="https://api.example.com/data"
-    )
+    spec = _spec("GET", "/data")
     
     response = await client.execute(spec)
     
@@ -467,29 +409,16 @@ async def test_http_client_execution_time_tracking(httpx_mock: HTTPXMock):
     assert response.execution_time_ms >= 0
 
 
-@pytest.mark.asyncio
-async def test_http_client_returns_http_response_spec(httpx_mock: HTTPXMock):
+async def test_http_client_returns_http_response_spec(client, routes):
     """Test that execute returns HTTPResponseSpec.
     
     Given: A valid HTTPRequestSpec
     When: Executing the request
     Then: Should return valid HTTPResponseSpec instance
     """
-    from dynamic_tools.services.http_client import HTTPClientService
+    routes[("GET", _API_BASE + "/test")] = _respond(200, json={"result": "ok"})
     
-    httpx_mock.add_response(
-        method="GET",
-        url="https://api.example.com/test",
-        json={"result": "ok"},
-        status_code=200
-    )
-    
-    client = HTTPClientService()
-    
-    spec = HTTPRequestSpec(
-        method="GET",
-        url="https://api.example.com/test"
-    )
+    spec = _spec("GET", "/test")
     
     response = await client.execute(spec)
     
@@ -500,61 +429,36 @@ async def test_http_client_returns_http_response_spec(httpx_mock: HTTPXMock):
     assert response.execution_time_ms is not None
 
 
-@pytest.mark.asyncio
-async def test_http_client_head_request(httpx_mock: HTTPXMock):
-    """Test executing a HEAD request.
+async def test_http_client_reuses_one_async_client():
+    """Test that the service keeps one pooled client until closed.
     
-    Given: A HEAD HTTPRequestSpec
-    When: Executing the request
-    Then: Should perform HEAD and return response with no body
+    Given: A service that creates its own httpx.AsyncClient
+    When: Getting its client repeatedly and then closing the service
+    Then: Should return the same client each time and close it on aclose()
     """
-    from dynamic_tools.services.http_client import HTTPClientService
-    
-    httpx_mock.add_response(
-        method="HEAD",
-        url="https://api.example.com/resource",
-        status_code=200,
-        headers={"Content-Length": "1234"}
-    )
+    service = HTTPClientService()
     
-    client = HTTPClientService()
+    pooled_client = service._get_client()
     
-    spec = HTTPRequestSpec(
-        method="HEAD",
-        url="https://api.example.com/resource"
-    )
-    
-    response = await client.execute(spec)
-    
-    assert response.status_code == 200
-    # HEAD requests typically have no body
+    assert service._get_client() is pooled_client
+    await service.aclose()
+    assert pooled_client.is_closed
 
 
-@pytest.mark.asyncio
-async def test_http_client_options_request(httpx_mock: HTTPXMock):
-    """Test executing an OPTIONS request.
+async def test_http_client_aclose_leaves_injected_client_open(mock_transport, routes):
+    """Test that the service only closes a client it created.
     
-    Given: An OPTIONS HTTPRequestSpec
-    When: Executing the request
-    Then: Should perform OPTIONS and return allowed methods
+    Given: A service built around a caller's httpx.AsyncClient
+    When: Executing a request and closing the service
+    Then: Should use the caller's client and leave it open
     """
-    from dynamic_tools.services.http_client import HTTPClientService
-    
-    httpx_mock.add_response(
-        method="OPTIONS",
-        url="https://api.example.com/resource",
-        status_code=200,
-        headers={"Allow": "GET, POST, PUT, DELETE"}
-    )
-    
-    client = HTTPClientService()
+    routes[("GET", _API_BASE + "/injected")] = _respond(200, json={"ok": True})
     
-    spec = HTTPRequestSpec(
-        method="OPTIONS",
-        url="https://api.example.com/resource"
-    )
+    async with httpx.AsyncClient(transport=mock_transport) as http_client:
+        async with HTTPClientService(client=http_client) as service:
+            response = await service.execute(
+                _spec("GET", "/injected")
+            )
     
-    response = await client.execute(spec)
-    
-    assert response.status_code == 200
-
+        assert response.status_code == 200
+        assert not http_client.is_closed
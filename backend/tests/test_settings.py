@@ -0,0 +1,27 @@
+"""Tests for application settings."""
+
+import pytest
+from pydantic import ValidationError
+
+from dynamic_tools.config.settings import Settings
+
+_REQUIRED = {"supabase_url": "https://test.supabase.co", "supabase_key": "test-key"}
+
+
+@pytest.mark.parametrize("pool_min, pool_max", [(0, 1), (10, 10)])
+def test_supabase_pool_bounds_accepted(pool_min, pool_max):
+    """Test that a pool minimum up to the maximum is accepted."""
+    settings = Settings(_env_file=None, supabase_pool_min=pool_min, supabase_pool_max=pool_max, **_REQUIRED)
+    
+    assert (settings.supabase_pool_min, settings.supabase_pool_max) == (pool_min, pool_max)
+
+
+@pytest.mark.parametrize("overrides", [
+    pytest.param({"supabase_pool_min": 20}, id="min-above-default-max"),
+    pytest.param({"supabase_pool_min": -1}, id="negative-min"),
+    pytest.param({"supabase_pool_max": 0}, id="zero-max"),
+])
+def test_supabase_pool_bounds_rejected(overrides):
+    """Test that pool sizes httpx.Limits can't use are rejected."""
+    with pytest.raises(ValidationError):
+        Settings(_env_file=None, **_REQUIRED, **overrides)
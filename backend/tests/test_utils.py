@@ -0,0 +1,85 @@
+"""Tests for utility functions."""
+
+import asyncio
+
+import pytest
+
+from dynamic_tools.core.base import ToolConfig, ToolExecutionError
+from dynamic_tools.utils import run_async, with_retry
+
+# Three retries doubling from one second: waits of 1, 2 and 4 seconds
+RETRY_CONFIG = ToolConfig(max_retries=3, retry_delay=1.0, backoff_factor=2.0)
+EXPECTED_WAITS = [1.0, 2.0, 4.0]
+
+
+def test_with_retry_sync_backoff_and_reraise():
+    """Test retrying a sync function that always fails.
+    
+    Given: A sync function decorated with with_retry that always raises
+    When: Calling it
+    Then: Should wait with exponential backoff between attempts and re-raise
+          the function's own exception
+    """
+    calls = 0
+    
+    @with_retry(RETRY_CONFIG)
+    def flaky():
+        nonlocal calls
+        calls += 1
+        raise ToolExecutionError(f"failure {calls}")
+    
+    waits = []
+    flaky.retry.sleep = waits.append
+    
+    with pytest.raises(ToolExecutionError, match="failure 4"):
+        flaky()
+    
+    assert calls == 4
+    assert waits == EXPECTED_WAITS
+
+
+@pytest.mark.asyncio
+async def test_with_retry_async_backoff_and_reraise(monkeypatch):
+    """Test retrying an async function that always fails.
+    
+    Given: An async function decorated with with_retry that always raises
+    When: Awaiting it
+    Then: Should wait as the sync path does and re-raise the function's own
+          exception
+    """
+    calls = 0
+    
+    @with_retry(RETRY_CONFIG)
+    async def flaky():
+        nonlocal calls
+        calls += 1
+        raise ToolExecutionError(f"failure {calls}")
+    
+    waits = []
+    real_sleep = asyncio.sleep
+    
+    async def record_sleep(delay):
+        waits.append(delay)
+        await real_sleep(0)
+    
+    monkeypatch.setattr(asyncio, "sleep", record_sleep)
+    
+    with pytest.raises(ToolExecutionError, match="failure 4"):
+        await flaky()
+    
+    assert calls == 4
+    assert waits == EXPECTED_WAITS
+
+
+def test_run_async_returns_result():
+    """Test running a script's main coroutine.
+    
+    Given: A coroutine that awaits and returns a value
+    When: Running it with run_async, on uvloop or the default loop
+    Then: Should return the coroutine's result
+    """
+    async def main():
+        await asyncio.sleep(0)
+        return 42
+    
+    assert run_async(main()) == 42
@@ -231,6 +231,9 @@ class TestExecuteWorkflow:
         assert response.raw_response is not None
         assert response.formatted_response is None
         assert response.error is None
+        # Unset spec fields are reported as null, not left out
+        assert response.http_spec["body"] is None
+        assert response.http_spec["headers"] is None
     
     @pytest.mark.asyncio
     async def test_successful_workflow_with_formatting(self, orchestrator):
@@ -11,190 +11,283 @@ Top Decks API. It will:
 Requirements:
 - OpenAI API key set in environment (OPENAI_API_KEY)
 - Backend server running on localhost:8000
+- Python 3.11+ (uses asyncio.TaskGroup)
+
+Set TEST_VERBOSE=1 to pretty-print full tool configs and workflow requests.
+
+Run it directly with python. It is deliberately not a pytest module: it needs
+a live backend and spends OpenAI credits, so it stays out of the offline suite
+in backend/tests. The scenarios already run concurrently within one process.
 """
 
 import asyncio
 import httpx
 import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
 from typing import Optional
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend', 'src'))
+
+from dynamic_tools.utils import run_async
+
+try:
+    import h2  # noqa: F401 - lets httpx negotiate HTTP/2 over TLS
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Configuration
 BASE_URL = "http://localhost:8000"
 RIFTBOUND_API_BASE = "https://riftbound-top-decks-api-git-main-stevenabouchedids-projects.vercel.app"
+VERBOSE = os.getenv("TEST_VERBOSE") == "1"
+
+log = logging.getLogger("riftbound_manual_test")
+MAX_RETRIES = 3
+RETRY_STATUSES = {429, 502, 503, 504}
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _to_json(obj, pretty: bool = False) -> str:
+    """Serialize obj for display, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+    return json.dumps(obj, indent=2 if pretty else None)
+
+
+def _to_json_bytes(obj) -> bytes:
+    """Encode a request body once, so httpx sends the bytes as-is."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _from_json(response: httpx.Response):
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _riftbound_tool_config(name: str, description: str, endpoint: str, output_description: str) -> dict:
+    """Build a no-auth GET tool config for a Riftbound API endpoint.
+    
+    Args:
+        name: Tool name
+        description: Tool description shown to the LLM
+        endpoint: API endpoint under /api (also the output key, e.g. "cards")
+        output_description: Description of the returned list
+        
+    Returns:
+        Tool configuration dict
+    """
+    return {
+        "name": name,
+        "description": description,
+        "version": 1,
+        "enabled": True,
+        "api": {
+            "base_url": f"{RIFTBOUND_API_BASE}/api/{endpoint}",
+            "path": "",
+            "method": "GET",
+            "headers": {},
+            "params": {},
+            "auth": {
+                "method": "none"
+            },
+            "timeout": 30.0
+        },
+        "input_schema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        },
+        "output_schema": {
+            "type": "object",
+            "properties": {
+                endpoint: {
+                    "type": "array",
+                    "description": output_description
+                }
+            }
+        },
+        "mapping": {
+            "input_to_params": {},
+            "input_to_body": {},
+            "response_to_output": {}
+        },
+        "tags": ["riftbound", endpoint, "game"]
+    }
 
 
 class RiftboundWorkflowTester:
     """Test harness for Riftbound API workflow."""
     
-    def __init__(self, base_url: str = BASE_URL):
+    def __init__(self, base_url: str = BASE_URL, client: Optional[httpx.AsyncClient] = None):
         self.base_url = base_url
-        self.client = httpx.AsyncClient(timeout=60.0)
+        # One pooled client for every call so follow-up requests reuse connections;
+        # callers may pass their own to share a pool with other harnesses
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
+            base_url=base_url,
+            headers={"Accept": "application/json"},
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            # The transport retries failed connects (e.g. backend still starting)
+            transport=httpx.AsyncHTTPTransport(
+                retries=3,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=4, max_connections=10),
+            ),
+        )
     
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Close the HTTP client if this tester created it."""
+        if self._owns_client:
+            await self.client.aclose()
     
     async def register_riftbound_cards_tool(self):
         """Register the Riftbound cards API tool."""
-        print("\n" + "="*80)
-        print("STEP 1: Registering Riftbound Cards Tool")
-        print("="*80)
+        log.info("\n" + "="*80)
+        log.info("STEP 1: Registering Riftbound Cards Tool")
+        log.info("="*80)
         
-        tool_config = {
-            "name": "get_riftbound_cards",
-            "description": "Get cards from the Riftbound card game API. Returns a list of all available cards with their properties including name, type, rarity, domain, energy, power, might, and description.",
-            "version": 1,
-            "enabled": True,
-            "api": {
-                "base_url": f"{RIFTBOUND_API_BASE}/api/cards",
-                "path": "",
-                "method": "GET",
-                "headers": {},
-                "params": {},
-                "auth": {
-                    "method": "none"
-                },
-                "timeout": 30.0
-            },
-            "input_schema": {
-                "type": "object",
-                "properties": {},
-                "required": []
-            },
-            "output_schema": {
-                "type": "object",
-                "properties": {
-                    "cards": {
-                        "type": "array",
-                        "description": "List of cards"
-                    }
-                }
-            },
-            "mapping": {
-                "input_to_params": {},
-                "input_to_body": {},
-                "response_to_output": {}
-            },
-            "tags": ["riftbound", "cards", "game"]
-        }
+        tool_config = _riftbound_tool_config(
+            name="get_riftbound_cards",
+            description="Get cards from the Riftbound card game API. Returns a list of all available cards with their properties including name, type, rarity, domain, energy, power, might, and description.",
+            endpoint="cards",
+            output_description="List of cards",
+        )
         
         # Note: In a real implementation, you would POST this to a tool registration endpoint
         # For now, we'll just show what would be registered
-        print(f"Tool Config: {json.dumps(tool_config, indent=2)}")
-        print("\n✓ Tool configuration prepared (would be registered via API)")
+        if VERBOSE:
+            log.info(f"Tool Config: {_to_json(tool_config, pretty=True)}")
+        log.info("\n✓ Tool configuration prepared (would be registered via API)")
         return "get_riftbound_cards"
     
     async def register_riftbound_decks_tool(self):
         """Register the Riftbound decks API tool."""
-        print("\n" + "="*80)
-        print("STEP 2: Registering Riftbound Decks Tool")
-        print("="*80)
+        log.info("\n" + "="*80)
+        log.info("STEP 2: Registering Riftbound Decks Tool")
+        log.info("="*80)
         
-        tool_config = {
-            "name": "get_riftbound_decks",
-            "description": "Get deck lists from the Riftbound card game API. Returns a list of player decks with their legend, owner, size, and metadata.",
-            "version": 1,
-            "enabled": True,
-            "api": {
-                "base_url": f"{RIFTBOUND_API_BASE}/api/decks",
-                "path": "",
-                "method": "GET",
-                "headers": {},
-                "params": {},
-                "auth": {
-                    "method": "none"
-                },
-                "timeout": 30.0
-            },
-            "input_schema": {
-                "type": "object",
-                "properties": {},
-                "required": []
-            },
-            "output_schema": {
-                "type": "object",
-                "properties": {
-                    "decks": {
-                        "type": "array",
-                        "description": "List of decks"
-                    }
-                }
-            },
-            "mapping": {
-                "input_to_params": {},
-                "input_to_body": {},
-                "response_to_output": {}
-            },
-            "tags": ["riftbound", "decks", "game"]
-        }
+        tool_config = _riftbound_tool_config(
+            name="get_riftbound_decks",
+            description="Get deck lists from the Riftbound card game API. Returns a list of player decks with their legend, owner, size, and metadata.",
+            endpoint="decks",
+            output_description="List of decks",
+        )
         
-        print(f"Tool Config: {json.dumps(tool_config, indent=2)}")
-        print("\n✓ Tool configuration prepared (would be registered via API)")
+        if VERBOSE:
+            log.info(f"Tool Config: {_to_json(tool_config, pretty=True)}")
+        log.info("\n✓ Tool configuration prepared (would be registered via API)")
         return "get_riftbound_decks"
     
+    async def check_backend(self) -> bool:
+        """Verify the backend is reachable before running any scenario."""
+        try:
+            response = await self.client.get(f"{self.base_url}/health")
+            response.raise_for_status()
+            return True
+        except Exception as e:
+            log.info(f"\n✗ Backend not reachable at {self.base_url}: {e}")
+            log.info("Make sure:")
+            log.info("  1. Backend is running (docker-compose up)")
+            log.info("  2. Tools are registered in the system")
+            log.info("  3. OPENAI_API_KEY is set")
+            return False
+    
+    async def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request, retrying transient 429/5xx responses with backoff."""
+        for attempt in range(MAX_RETRIES + 1):
+            response = await self.client.request(method, url, **kwargs)
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                return response
+            retry_after = response.headers.get("Retry-After", "")
+            delay = float(retry_after) if retry_after.isdigit() else 0.5 * 2 ** attempt
+            await response.aclose()
+            await asyncio.sleep(delay + random.uniform(0, 0.25))
+        return response
+    
+    async def _post_workflow(self, workflow_request: dict):
+        """POST a workflow request, returning (response, error)."""
+        try:
+            response = await self._send(
+                "POST",
+                f"{self.base_url}/workflow",
+                content=_to_json_bytes(workflow_request),
+                headers=_JSON_HEADERS,
+            )
+            return response, None
+        except Exception as e:
+            return None, e
+    
     async def test_workflow_cards_simple(self):
         """Test workflow: Get 5 random Fury cards (simplified - just get cards)."""
-        print("\n" + "="*80)
-        print("TEST 1: Get Riftbound Cards (No Formatting)")
-        print("="*80)
-        
         workflow_request = {
             "user_instructions": "Get all cards from the Riftbound API",
             "tool_ids": ["get_riftbound_cards"],
             "format_response": False
         }
         
-        print(f"\nWorkflow Request:")
-        print(json.dumps(workflow_request, indent=2))
+        response, error = await self._post_workflow(workflow_request)
         
+        # Emit the block in one write once the call returns so concurrent tests stay readable
+        out = []
         try:
-            print("\n[REAL CALL] Calling POST /workflow...")
-            response = await self.client.post(
-                f"{self.base_url}/workflow",
-                json=workflow_request,
-                timeout=60.0
-            )
+            out.append("\n" + "="*80)
+            out.append("TEST 1: Get Riftbound Cards (No Formatting)")
+            out.append("="*80)
+            
+            out.append(f"\nWorkflow Request:")
+            out.append(_to_json(workflow_request, pretty=VERBOSE))
+            
+            out.append("\n[REAL CALL] Called POST /workflow")
+            
+            if error is not None:
+                out.append(f"\n✗ ERROR: {error}")
+                return None
             
             if response.status_code == 200:
-                result = response.json()
-                print("\n✓ SUCCESS!")
-                print(f"Status: {result.get('status')}")
-                print(f"Selected Tool: {result.get('selected_tool')}")
+                result = _from_json(response)
+                out.append("\n✓ SUCCESS!")
+                out.append(f"Status: {result.get('status')}")
+                out.append(f"Selected Tool: {result.get('selected_tool')}")
                 
                 if result.get('http_spec'):
-                    print(f"\nHTTP Spec Generated:")
-                    print(f"  Method: {result['http_spec'].get('method')}")
-                    print(f"  URL: {result['http_spec'].get('url')}")
+                    out.append(f"\nHTTP Spec Generated:")
+                    out.append(f"  Method: {result['http_spec'].get('method')}")
+                    out.append(f"  URL: {result['http_spec'].get('url')}")
                 
                 if result.get('raw_response'):
                     raw = result['raw_response']
-                    print(f"\nAPI Response:")
-                    print(f"  Status Code: {raw.get('status_code')}")
+                    out.append(f"\nAPI Response:")
+                    out.append(f"  Status Code: {raw.get('status_code')}")
                     if isinstance(raw.get('body'), list):
-                        print(f"  Cards Retrieved: {len(raw['body'])}")
-                        print(f"  First Card: {raw['body'][0].get('name') if raw['body'] else 'N/A'}")
+                        out.append(f"  Cards Retrieved: {len(raw['body'])}")
+                        out.append(f"  First Card: {raw['body'][0].get('name') if raw['body'] else 'N/A'}")
                     else:
-                        print(f"  Body: {str(raw.get('body'))[:200]}...")
+                        out.append(f"  Body: {str(raw.get('body'))[:200]}...")
                 
                 return result
             else:
-                print(f"\n✗ ERROR: Status {response.status_code}")
-                print(response.text)
-                
-        except Exception as e:
-            print(f"\n✗ ERROR: {e}")
-            print("Make sure:")
-            print("  1. Backend is running (docker-compose up)")
-            print("  2. Tools are registered in the system")
-            print("  3. OPENAI_API_KEY is set")
+                out.append(f"\n✗ ERROR: Status {response.status_code}")
+                out.append(response.text[:500])
+        finally:
+            log.info("\n".join(out))
     
     async def test_workflow_cards_with_formatting(self):
         """Test workflow: Get cards with LLM formatting to find Fury cards."""
-        print("\n" + "="*80)
-        print("TEST 2: Get 5 Random Fury Cards (With Formatting)")
-        print("="*80)
-        
         workflow_request = {
             "user_instructions": "Get all cards from the Riftbound API",
             "tool_ids": ["get_riftbound_cards"],
@@ -202,51 +295,53 @@ class RiftboundWorkflowTester:
             "response_format_instructions": "From the response, randomly select 5 cards that have 'Fury' as their domain. List each card's name, energy cost, power, might, and description in a clear, readable format."
         }
         
-        print(f"\nWorkflow Request:")
-        print(json.dumps(workflow_request, indent=2))
+        response, error = await self._post_workflow(workflow_request)
         
+        # Emit the block in one write once the call returns so concurrent tests stay readable
+        out = []
         try:
-            print("\n[REAL CALL] Calling POST /workflow...")
-            response = await self.client.post(
-                f"{self.base_url}/workflow",
-                json=workflow_request,
-                timeout=60.0
-            )
+            out.append("\n" + "="*80)
+            out.append("TEST 2: Get 5 Random Fury Cards (With Formatting)")
+            out.append("="*80)
+            
+            out.append(f"\nWorkflow Request:")
+            out.append(_to_json(workflow_request, pretty=VERBOSE))
+            
+            out.append("\n[REAL CALL] Called POST /workflow")
+            
+            if error is not None:
+                out.append(f"\n✗ ERROR: {error}")
+                out.append("This test requires OpenAI API key and tools to be registered.")
+                return None
             
             if response.status_code == 200:
-                result = response.json()
-                print("\n✓ SUCCESS!")
-                print(f"Status: {result.get('status')}")
-                print(f"Selected Tool: {result.get('selected_tool')}")
+                result = _from_json(response)
+                out.append("\n✓ SUCCESS!")
+                out.append(f"Status: {result.get('status')}")
+                out.append(f"Selected Tool: {result.get('selected_tool')}")
                 
                 if result.get('formatted_response'):
-                    print(f"\n📝 LLM Formatted Response:")
-                    print("="*80)
-                    print(result['formatted_response'])
-                    print("="*80)
+                    out.append(f"\n📝 LLM Formatted Response:")
+                    out.append("="*80)
+                    out.append(result['formatted_response'])
+                    out.append("="*80)
                 
                 if result.get('raw_response'):
                     raw = result['raw_response']
-                    print(f"\n📊 Raw Data:")
-                    print(f"  Status Code: {raw.get('status_code')}")
+                    out.append(f"\n📊 Raw Data:")
+                    out.append(f"  Status Code: {raw.get('status_code')}")
                     if isinstance(raw.get('body'), list):
-                        print(f"  Total Cards: {len(raw['body'])}")
+                        out.append(f"  Total Cards: {len(raw['body'])}")
                 
                 return result
             else:
-                print(f"\n✗ ERROR: Status {response.status_code}")
-                print(response.text)
-                
-        except Exception as e:
-            print(f"\n✗ ERROR: {e}")
-            print("This test requires OpenAI API key and tools to be registered.")
+                out.append(f"\n✗ ERROR: Status {response.status_code}")
+                out.append(response.text[:500])
+        finally:
+            log.info("\n".join(out))
     
     async def test_workflow_decks(self):
         """Test workflow: Get deck information."""
-        print("\n" + "="*80)
-        print("TEST 3: Get Riftbound Decks (With Formatting)")
-        print("="*80)
-        
         workflow_request = {
             "user_instructions": "Get all decks from the Riftbound API",
             "tool_ids": ["get_riftbound_decks"],
@@ -254,43 +349,45 @@ class RiftboundWorkflowTester:
             "response_format_instructions": "Summarize the top 5 most recent decks, showing the deck name, legend used, owner, and deck size. Present it in a clean, easy-to-read format."
         }
         
-        print(f"\nWorkflow Request:")
-        print(json.dumps(workflow_request, indent=2))
+        response, error = await self._post_workflow(workflow_request)
         
+        # Emit the block in one write once the call returns so concurrent tests stay readable
+        out = []
         try:
-            print("\n[REAL CALL] Calling POST /workflow...")
-            response = await self.client.post(
-                f"{self.base_url}/workflow",
-                json=workflow_request,
-                timeout=60.0
-            )
+            out.append("\n" + "="*80)
+            out.append("TEST 3: Get Riftbound Decks (With Formatting)")
+            out.append("="*80)
+            
+            out.append(f"\nWorkflow Request:")
+            out.append(_to_json(workflow_request, pretty=VERBOSE))
+            
+            out.append("\n[REAL CALL] Called POST /workflow")
+            
+            if error is not None:
+                out.append(f"\n✗ ERROR: {error}")
+                return None
             
             if response.status_code == 200:
-                result = response.json()
-                print("\n✓ SUCCESS!")
-                print(f"Status: {result.get('status')}")
-                print(f"Selected Tool: {result.get('selected_tool')}")
+                result = _from_json(response)
+                out.append("\n✓ SUCCESS!")
+                out.append(f"Status: {result.get('status')}")
+                out.append(f"Selected Tool: {result.get('selected_tool')}")
                 
                 if result.get('formatted_response'):
-                    print(f"\n📝 LLM Formatted Response:")
-                    print("="*80)
-                    print(result['formatted_response'])
-                    print("="*80)
+                    out.append(f"\n📝 LLM Formatted Response:")
+                    out.append("="*80)
+                    out.append(result['formatted_response'])
+                    out.append("="*80)
                 
                 return result
             else:
-                print(f"\n✗ ERROR: Status {response.status_code}")
-                print(response.text)
-                
-        except Exception as e:
-            print(f"\n✗ ERROR: {e}")
+                out.append(f"\n✗ ERROR: Status {response.status_code}")
+                out.append(response.text[:500])
+        finally:
+            log.info("\n".join(out))
     
     async def test_workflow_multi_tool(self):
         """Test workflow: LLM chooses between cards and decks."""
-        print("\n" + "="*80)
-        print("TEST 4: Multi-Tool Selection (LLM Chooses)")
-        print("="*80)
-        
         workflow_request = {
             "user_instructions": "Show me information about Riftbound deck lists",
             "tool_ids": ["get_riftbound_cards", "get_riftbound_decks"],
@@ -298,112 +395,138 @@ class RiftboundWorkflowTester:
             "response_format_instructions": "Give me a brief summary of what you found."
         }
         
-        print(f"\nWorkflow Request:")
-        print(json.dumps(workflow_request, indent=2))
+        response, error = await self._post_workflow(workflow_request)
         
+        # Emit the block in one write once the call returns so concurrent tests stay readable
+        out = []
         try:
-            print("\n[REAL CALL] Calling POST /workflow...")
-            print("LLM will choose between 2 tools based on user intent...")
+            out.append("\n" + "="*80)
+            out.append("TEST 4: Multi-Tool Selection (LLM Chooses)")
+            out.append("="*80)
             
-            response = await self.client.post(
-                f"{self.base_url}/workflow",
-                json=workflow_request,
-                timeout=60.0
-            )
+            out.append(f"\nWorkflow Request:")
+            out.append(_to_json(workflow_request, pretty=VERBOSE))
+            
+            out.append("\n[REAL CALL] Called POST /workflow")
+            out.append("LLM chose between 2 tools based on user intent")
+            
+            if error is not None:
+                out.append(f"\n✗ ERROR: {error}")
+                return None
             
             if response.status_code == 200:
-                result = response.json()
-                print("\n✓ SUCCESS!")
-                print(f"Status: {result.get('status')}")
-                print(f"\n🤖 LLM Selected Tool: {result.get('selected_tool')}")
-                print("   (Expected: get_riftbound_decks based on 'deck lists' in instruction)")
+                result = _from_json(response)
+                out.append("\n✓ SUCCESS!")
+                out.append(f"Status: {result.get('status')}")
+                out.append(f"\n🤖 LLM Selected Tool: {result.get('selected_tool')}")
+                out.append("   (Expected: get_riftbound_decks based on 'deck lists' in instruction)")
                 
                 if result.get('formatted_response'):
-                    print(f"\n📝 LLM Formatted Response:")
-                    print("="*80)
-                    print(result['formatted_response'])
-                    print("="*80)
+                    out.append(f"\n📝 LLM Formatted Response:")
+                    out.append("="*80)
+                    out.append(result['formatted_response'])
+                    out.append("="*80)
                 
                 return result
             else:
-                print(f"\n✗ ERROR: Status {response.status_code}")
-                print(response.text)
-                
-        except Exception as e:
-            print(f"\n✗ ERROR: {e}")
+                out.append(f"\n✗ ERROR: Status {response.status_code}")
+                out.append(response.text[:500])
+        finally:
+            log.info("\n".join(out))
     
     async def test_direct_api_call(self):
         """Make a direct API call to verify the API works."""
-        print("\n" + "="*80)
-        print("BONUS: Direct API Call (Verification)")
-        print("="*80)
-        
-        print(f"\nCalling: {RIFTBOUND_API_BASE}/api/cards")
+        try:
+            response = await self._send("GET", f"{RIFTBOUND_API_BASE}/api/cards")
+        except Exception as e:
+            response, error = None, e
+        else:
+            error = None
         
+        # Emit in one write after the call returns, like the workflow scenarios it runs beside
+        out = []
         try:
-            response = await self.client.get(f"{RIFTBOUND_API_BASE}/api/cards")
-            cards = response.json()
-            
-            # Filter for Fury cards
-            fury_cards = [c for c in cards if c.get("domain") == "Fury"]
+            out.append("\n" + "="*80)
+            out.append("BONUS: Direct API Call (Verification)")
+            out.append("="*80)
             
-            print(f"\n✓ API Response:")
-            print(f"  - Total cards: {len(cards)}")
-            print(f"  - Fury cards: {len(fury_cards)}")
+            out.append(f"\nCalled: {RIFTBOUND_API_BASE}/api/cards")
             
-            # Show 3 random Fury cards
-            import random
-            sample_cards = random.sample(fury_cards, min(3, len(fury_cards)))
-            
-            print(f"\n  Sample Fury Cards:")
-            for card in sample_cards:
-                print(f"    - {card['name']} (Energy: {card['energy']}, Might: {card['might']})")
-            
-            return True
-        except Exception as e:
-            print(f"\n✗ Error: {e}")
-            return False
+            try:
+                if error is not None:
+                    raise error
+                cards = _from_json(response)
+                
+                # Filter for Fury cards
+                fury_cards = [c for c in cards if c.get("domain") == "Fury"]
+                
+                out.append(f"\n✓ API Response:")
+                out.append(f"  - Total cards: {len(cards)}")
+                out.append(f"  - Fury cards: {len(fury_cards)}")
+                out.append(f"  - Protocol: {response.http_version}")
+                
+                # Show 3 random Fury cards
+                sample_cards = random.sample(fury_cards, min(3, len(fury_cards)))
+                
+                out.append(f"\n  Sample Fury Cards:")
+                for card in sample_cards:
+                    out.append(f"    - {card['name']} (Energy: {card['energy']}, Might: {card['might']})")
+                
+                return True
+            except Exception as e:
+                out.append(f"\n✗ Error: {e}")
+                return False
+        finally:
+            log.info("\n".join(out))
     
     async def run_all_tests(self):
         """Run all test scenarios."""
-        print("\n" + "#"*80)
-        print("# RIFTBOUND MCP WORKFLOW MANUAL TEST SUITE (REAL CALLS)")
-        print("#"*80)
-        print("\n⚠️  WARNING: This test makes REAL API calls!")
-        print("   - Calls OpenAI API (costs ~$0.01-0.05 total)")
-        print("   - Calls Riftbound API (free)")
-        print("   - Requires backend server running on localhost:8000")
-        print("   - Requires OPENAI_API_KEY set in backend/.env")
-        print("   - Requires tools to be registered in the system")
-        print("\nPress Ctrl+C to cancel...")
-        print("\nStarting tests in 3 seconds...")
-        import asyncio
+        log.info("\n" + "#"*80)
+        log.info("# RIFTBOUND MCP WORKFLOW MANUAL TEST SUITE (REAL CALLS)")
+        log.info("#"*80)
+        log.info("\n⚠️  WARNING: This test makes REAL API calls!")
+        log.info("   - Calls OpenAI API (costs ~$0.01-0.05 total)")
+        log.info("   - Calls Riftbound API (free)")
+        log.info("   - Requires backend server running on localhost:8000")
+        log.info("   - Requires OPENAI_API_KEY set in backend/.env")
+        log.info("   - Requires tools to be registered in the system")
+        log.info("\nPress Ctrl+C to cancel...")
+        log.info("\nStarting tests in 3 seconds...")
         await asyncio.sleep(3)
         
+        # Check the backend once up front instead of letting every scenario fail
+        if not await self.check_backend():
+            return
+        
         # Register tools
         await self.register_riftbound_cards_tool()
         await self.register_riftbound_decks_tool()
         
-        # Run test scenarios
-        await self.test_workflow_cards_simple()
-        await self.test_workflow_cards_with_formatting()
-        await self.test_workflow_decks()
-        await self.test_workflow_multi_tool()
-        
-        # Bonus: Direct API call
-        await self.test_direct_api_call()
+        # Run test scenarios and the bonus direct API call concurrently;
+        # they share no state
+        # TaskGroup cancels the remaining calls as soon as one fails unexpectedly
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self.test_workflow_cards_simple())
+                tg.create_task(self.test_workflow_cards_with_formatting())
+                tg.create_task(self.test_workflow_decks())
+                tg.create_task(self.test_workflow_multi_tool())
+                tg.create_task(self.test_direct_api_call())
+        except Exception as group:
+            for error in getattr(group, "exceptions", [group]):
+                log.info(f"\n✗ ERROR: {error}")
         
-        print("\n" + "#"*80)
-        print("# TEST SUITE COMPLETE")
-        print("#"*80)
-        print("\nTo execute these workflows for real:")
-        print(f"  curl -X POST {BASE_URL}/workflow \\")
-        print("    -H 'Content-Type: application/json' \\")
-        print("    -d '{")
-        print('      "user_instructions": "Get 5 random Fury cards",')
-        print('      "tool_ids": ["get_riftbound_cards"],')
-        print('      "format_response": true')
-        print("    }'")
+        log.info("\n" + "#"*80)
+        log.info("# TEST SUITE COMPLETE")
+        log.info("#"*80)
+        log.info("\nTo execute these workflows for real:")
+        log.info(f"  curl -X POST {BASE_URL}/workflow \\")
+        log.info("    -H 'Content-Type: application/json' \\")
+        log.info("    -d '{")
+        log.info('      "user_instructions": "Get 5 random Fury cards",')
+        log.info('      "tool_ids": ["get_riftbound_cards"],')
+        log.info('      "format_response": true')
+        log.info("    }'")
 
 
 async def main():
@@ -415,5 +538,22 @@ async def main():
         await tester.close()
 
 
+def _start_log_listener() -> logging.handlers.QueueListener:
+    """Hand log records to a background thread so stdout writes never block the event loop."""
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(message)s",
+        handlers=[logging.handlers.QueueHandler(records)],
+    )
+    listener = logging.handlers.QueueListener(records, logging.StreamHandler(sys.stdout))
+    listener.start()
+    return listener
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    listener = _start_log_listener()
+    try:
+        run_async(main())
+    finally:
+        listener.stop()